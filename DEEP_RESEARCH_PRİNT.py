@@ -1,35 +1,52 @@
 #!/usr/bin/env python3
 import threading
 import time
+STARTUP_STARTED = time.perf_counter()  # Başlangıç süresi ölçümü
 import json
 import os
 import sys
+from concurrent.futures import CancelledError
 import tkinter as tk
 from tkinter import ttk, messagebox, Scale, IntVar
 import requests
-import pyautogui
 import pytesseract
 from pytesseract import TesseractNotFoundError
 import keyboard
-from googletrans import Translator
+from PIL import Image
 
-try:
-    from transformers import TrOCRProcessor, VisionEncoderDecoderModel
-    from PIL import Image
-    TROCR_AVAILABLE = True
-except ImportError:
-    TROCR_AVAILABLE = False
-
-# DocTR için gerekli importlar
-try:
-    import doctr
-    from doctr.io import DocumentFile
-    from doctr.models import ocr_predictor
-    DOCTR_AVAILABLE = True
-    print("DocTR başarıyla import edildi")
-except (ImportError, ModuleNotFoundError) as e:
-    print(f"DocTR import hatası: {e}")
-    DOCTR_AVAILABLE = False
+from startup import (
+    ASYNC_HTTPX_MIN_VERSION, OCR_ENGINE_MODULES, TRANSLATOR_MODULES, StartupTimer, module_available,
+    module_version_at_least
+)
+from frame_tools import FrameChangeDetector, LineTracker, ScrollTracker
+from capture import create_capture
+from preprocessing import Preprocessor
+from ocr_cache import OCRResultCache
+from text_tracking import IncrementalTranslator, JitterFilter, TextStabilizer
+from translation_cache import TranslationCache
+from http_pool import HTTPSessionPool
+from server_pool import ServerPool
+from hedging import HedgedCaller, LatencyStats
+from batch_translation import BatchTranslationError, google_batch, libretranslate_batch, pack_batches
+from argos_backend import (
+    ArgosBatchTranslator, ArgosLanguageError, ArgosTranslationCache, normalize_lang, resolve_workers
+)
+from pipeline import AdaptiveScheduler, Pipeline, PipelineStage
+from ui_updates import UIUpdateQueue
+from ocr_engines import OCR_ENGINES, OCREngineRegistry
+
+# Ağır OCR/çeviri kütüphaneleri burada import edilmez; yalnızca kurulu olup
+# olmadıklarına bakılır. Seçilen motor/servis ilk kullanımda yüklenir.
+EASYOCR_AVAILABLE = module_available(*OCR_ENGINE_MODULES['easyocr'])
+TROCR_AVAILABLE = module_available(*OCR_ENGINE_MODULES['trocr'])
+DOCTR_AVAILABLE = module_available(*OCR_ENGINE_MODULES['doctr'])
+GOOGLE_AVAILABLE = module_available(*TRANSLATOR_MODULES['google'])
+ARGOS_AVAILABLE = module_available(*TRANSLATOR_MODULES['argos'])
+# Eski httpx (ör. googletrans==4.0.0-rc1 ile gelen 0.13) varsa senkron HTTPSessionPool yolu kullanılır
+ASYNC_AVAILABLE = module_available('httpx') and module_version_at_least('httpx', ASYNC_HTTPX_MIN_VERSION)
+
+startup_timer = StartupTimer(STARTUP_STARTED)
+startup_timer.mark('import')
 
 # -----------------------------------------------------
 # TESSERACT YOLU AYARI
@@ -40,19 +57,68 @@ pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tessera
 # AYAR DOSYASI YÖNETİMİ
 # -----------------------------------------------------
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), 'settings.json')
+TRANSLATION_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'translation_cache.db')
 
 def load_settings():
     default = {
         'region': {'x': 100, 'y': 100, 'width': 400, 'height': 200},
         'display': {'x': 600, 'y': 100, 'width': 500, 'height': 200},
         'source_display': {'x': 600, 'y': 320, 'width': 500, 'height': 200},
-        'interval_ms': 1000,
+        'interval_ms': 1000,  # Uyarlamalı modda en uzun tarama aralığı
         'wraplength': 480,
         'source_lang': 'en',
         'target_lang': 'tr',
         'translator_service': 'google',
         'ocr_engine': 'tesseract',  # 'tesseract', 'easyocr', 'trocr', 'doctr'
-        'cpu_workers': 0  # 0 = tüm çekirdekler
+        'cpu_workers': 0,  # 0 = tüm çekirdekler
+        'frame_diff_block': 8,  # Kare karşılaştırması için blok boyu (piksel, block x block)
+        'frame_diff_tolerance': 8,  # Blok başına izin verilen gri ton farkı (0-255)
+        'translation_cache_enabled': True,
+        'translation_cache_size': 2000,  # Bellekte tutulacak çeviri sayısı
+        'translation_cache_disk_size': 50000,  # Diskte tutulacak çeviri sayısı
+        'pipeline_queue_size': 1,  # Aşamalar arası kuyruk boyu (dolunca en eski atılır)
+        'ui_fps': 30,  # Arayüz güncellemelerinin uygulanma hızı (kare/sn)
+        'ocr_warm_engines': 2,  # Bellekte hazır tutulacak OCR motoru sayısı
+        'tesseract_psm': 6,  # Sayfa bölütleme modu (6 = tek metin bloğu)
+        'tesseract_oem': 3,  # OCR motor modu (3 = varsayılan)
+        'line_tracking': False,  # Büyük bölgelerde yalnızca değişen satırları OCR'la ve çevir
+        'http_pool_size': 4,  # Sunucu başına açık tutulacak en fazla bağlantı
+        'libre_probe_interval_s': 10,  # Devre kesicisi açık sunucuları yoklama aralığı (sn)
+        'race_mode': False,  # Birincil servis gecikirse yedek servise de istek gönder
+        'race_hedge_service': 'libretranslate',  # Yedek servis (aynıysa ikinci sunucu kullanılır)
+        'race_hedge_delay_ms': 300,  # Yedek isteğin gönderilmeden önce beklenecek süre
+        'async_translation': True,  # Google/LibreTranslate isteklerini asyncio istemcisiyle gönder
+        'async_max_in_flight': 8,  # Aynı anda uçuşta olabilecek en fazla istek
+        'translation_deadline_s': 10,  # Tek bir çeviri için toplam süre sınırı (yeniden denemeler dahil)
+        'batch_translation': True,  # Satır takibinde satırları tek istekte toplu çevir
+        'batch_max_payload_bytes': 4000,  # Tek toplu istekteki en fazla metin boyutu
+        'adaptive_interval': True,  # Bölge değiştikçe sık, durağanken seyrek tara
+        'interval_min_ms': 100,  # Uyarlamalı modda en kısa tarama aralığı
+        'cpu_budget_percent': 25,  # Yakalama için ayrılan tek çekirdek yüzdesi
+        'capture_backend': 'auto',  # 'auto', 'mss' ya da 'pyautogui'
+        'preprocess_enabled': True,  # OCR öncesi ön işleme
+        'preprocess_grayscale': True,  # Tek kanala indir
+        'preprocess_normalize': True,  # Kontrastı 0..255 aralığına ger
+        'preprocess_threshold': False,  # Uyarlamalı eşikle siyah-beyaz yap
+        'preprocess_threshold_window': 31,  # Eşik penceresi (piksel)
+        'preprocess_threshold_offset': 10,  # Yerel ortalamadan yüzde kaç koyu metin sayılır
+        'preprocess_upscale': 1,  # Tam sayı büyütme katı (küçük yazılar için 2-3)
+        'preprocess_crop': True,  # Metnin sınır kutusuna kırp
+        'preprocess_crop_padding': 8,  # Kırpma kutusu kenar payı (piksel)
+        'ocr_cache_enabled': True,  # Daha önce görülmüş kareler için OCR'ı atla
+        'ocr_cache_size': 256,  # Bellekte tutulacak en fazla kare sonucu
+        'ocr_cache_max_kb': 4096,  # OCR önbelleğinin yaklaşık bellek sınırı
+        'jitter_filter': True,  # Neredeyse aynı OCR okumalarını değişmemiş say
+        'jitter_similarity': 0.9,  # 0-1 arası; bu orandan benzer okumalar aynı metindir
+        'jitter_history': 3,  # Gösterilen metnin hatırlanan OCR varyantı sayısı
+        'text_stabilization': True,  # Harf harf beliren metni büyümesi bitince çevir
+        'stabilize_frames': 2,  # Metin bu kadar okuma boyunca büyümezse oturmuş sayılır
+        'stabilize_ms': 300,  # ...ya da bu kadar milisaniye boyunca
+        'provisional_translation': False,  # Metin büyürken geçici çeviri göster
+        'provisional_interval_ms': 1000,  # Geçici çeviriler arasındaki en kısa süre
+        'incremental_translation': True,  # Kayan sohbet/günlük bölgelerinde yalnızca yeni satırları çevir
+        'scroll_tracking': False,  # Bölge kayınca yalnızca açığa çıkan şeridi OCR'la
+        'scroll_max_shift_ratio': 0.5  # Aranacak en büyük kayma (bölge yüksekliğine oranı)
     }
     
     if os.path.exists(SETTINGS_FILE):
@@ -84,8 +150,18 @@ config = load_settings()
 # -----------------------------------------------------
 # ÇEVİRİ SERVİSLERİ
 # -----------------------------------------------------
-# Google Translate
-translator = Translator()
+# Google Translate (googletrans ilk çeviride import edilir)
+translator = None
+
+def new_translator():
+    from googletrans import Translator
+    return Translator()
+
+def get_translator():
+    global translator
+    if translator is None:
+        translator = new_translator()
+    return translator
 
 # LibreTranslate Bağlantıları
 LIBRE_TRANSLATE_URLS = [
@@ -96,69 +172,114 @@ LIBRE_TRANSLATE_URLS = [
     "https://translate.fedilab.app/translate",        # Fedilab sunucusu  
     "https://libretranslate.com/translate"            # Ana sunucu (kotalı olduğu için sona eklendi)
 ]
-CURRENT_LIBRE_URL_INDEX = 0
+# Gecikme/hata takipli sunucu seçimi ve devre kesici
+libre_servers = ServerPool(LIBRE_TRANSLATE_URLS)
+
+# Sunucu başına kalıcı bağlantı havuzu (her istekte DNS/TCP/TLS kurulumunu önler)
+http_pool = HTTPSessionPool(pool_size=config['http_pool_size'])
+
+# Çeviri önbelleği (tekrar eden satırlar için ağ isteğini atlar)
+translation_cache = TranslationCache(
+    TRANSLATION_CACHE_FILE if config['translation_cache_enabled'] else None,
+    max_entries=config['translation_cache_size'],
+    max_disk_entries=config['translation_cache_disk_size']
+)
+
+# Asenkron istemci: çevrimiçi servislerde çok sayıda satır aynı anda uçuşta olabilir
+async_client = None
+
+def ensure_async_client():
+    """Asenkron istemciyi yalnızca çevrimiçi bir servis seçiliyse oluşturur (httpx geç yüklenir)"""
+    global async_client
+    if async_client is not None or not ASYNC_AVAILABLE or not config['async_translation']:
+        return
+    if config['translator_service'] not in ('google', 'libretranslate'):
+        return
+    from async_translation import AsyncTranslationClient
+    async_client = AsyncTranslationClient(
+        libre_servers, new_translator, max_in_flight=config['async_max_in_flight'],
+        on_progress=lambda status: update_progress_bar(status)  # UI kuyruğu üzerinden
+    )
+    # Asenkron LibreTranslate istekleri de "HTTP: N istek / M bağlantı" satırında sayılsın
+    http_pool.add_stats_source(async_client.host_stats)
+
+ensure_async_client()
+
+# Arka uç gecikme istatistikleri ve yarış modu için yedekli istekler
+backend_latency = LatencyStats()
+hedged_caller = HedgedCaller(backend_latency)
 
 # Argos Translate
-try:
-    import argostranslate.package
-    import argostranslate.translate
-    ARGOS_AVAILABLE = True
-except ImportError:
-    ARGOS_AVAILABLE = False
+# CTranslate2'nin aynı anda birden fazla çeviri yürütebilmesi için (import'tan önce okunur)
+os.environ.setdefault('ARGOS_INTER_THREADS', str(resolve_workers(config['cpu_workers'])))
+
+# (kaynak, hedef) başına çözümlenmiş Argos çeviri nesneleri
+argos_translations = ArgosTranslationCache()
+# Uzun metinler cümlelere bölünüp cpu_workers kadar iş parçacığında çevrilir
+argos_batch = ArgosBatchTranslator(argos_translations, resolve_workers(config['cpu_workers']))
 
 # -----------------------------------------------------
 # ÇEVİRİ FONKSİYONLARI
 # -----------------------------------------------------
 def translate_with_google(text, source_lang="en", target_lang="tr"):
     """Google Translate API kullanarak çeviri yapar"""
+    global translator
     if not text:
         return ""
+    if not GOOGLE_AVAILABLE:
+        return "[Google Translate kullanılamıyor: pip install googletrans==4.0.0-rc1]"
     max_retries = 3
     for i in range(max_retries):
         try:
-            result = translator.translate(text, src=source_lang, dest=target_lang)
+            result = get_translator().translate(text, src=source_lang, dest=target_lang)
             return result.text
         except Exception as e:
             if i < max_retries - 1:
                 time.sleep(1)
-                translator = Translator()  # Yeni çevirmen nesnesi oluştur
+                if translation_superseded():
+                    raise CancelledError()
+                translator = new_translator()  # Yeni çevirmen nesnesi oluştur
             else:
                 return f"[Çeviri Hatası: {str(e)}]"
 
-def translate_with_libretranslate(text, source_lang="en", target_lang="tr"):
-    """LibreTranslate API kullanarak çeviri yapar"""
-    global CURRENT_LIBRE_URL_INDEX
+def libretranslate_request(url, text, source_lang, target_lang, timeout=8):
+    """Tek bir LibreTranslate sunucusuna istek gönderir ve yanıtı döner"""
+    payload = {
+        "q": text,
+        "source": source_lang,
+        "target": target_lang,
+        "format": "text",
+        "api_key": ""  # API anahtarı gerektiren sunucular için boş anahtar
+    }
     
+    headers = {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "Accept": "application/json",
+        "User-Agent": "OCRTranslator/1.0"  # Kullanıcı Ajanı ekleyerek bazı sunucuların engellemesini önle
+    }
+    return http_pool.post(url, data=payload, headers=headers, timeout=timeout)
+
+def translate_with_libretranslate(text, source_lang="en", target_lang="tr", urls=None):
+    """LibreTranslate API kullanarak çeviri yapar"""
     if not text:
         return ""
     
-    # Tüm LibreTranslate URL'lerini dene
-    for _ in range(len(LIBRE_TRANSLATE_URLS)):
+    # Sunucuları en hızlı sağlıklı olandan başlayarak dene
+    for url in urls or libre_servers.candidates():
+        # Dil/bölge değiştiyse eski metin için sıradaki sunucunun zaman aşımını bekleme
+        if translation_superseded():
+            raise CancelledError()
+        started = time.perf_counter()
         try:
-            url = LIBRE_TRANSLATE_URLS[CURRENT_LIBRE_URL_INDEX]
-            payload = {
-                "q": text,
-                "source": source_lang,
-                "target": target_lang,
-                "format": "text",
-                "api_key": ""  # API anahtarı gerektiren sunucular için boş anahtar
-            }
-            
-            headers = {
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Accept": "application/json",
-                "User-Agent": "OCRTranslator/1.0"  # Kullanıcı Ajanı ekleyerek bazı sunucuların engellemesini önle
-            }
-            
             # Yükleme çubuğunu test moduna getir
             update_progress_bar("testing")
             
-            # Zaman aşımını 8 saniyeye çıkar
-            response = requests.post(url, data=payload, headers=headers, timeout=8)
+            response = libretranslate_request(url, text, source_lang, target_lang)
             
             if response.status_code == 200:
-                update_progress_bar("success")
                 result = response.json()
+                libre_servers.record_success(url, (time.perf_counter() - started) * 1000)
+                update_progress_bar("success")
                 # Bazı sunucular farklı yanıt formatı kullanabilir
                 if "translatedText" in result:
                     return result["translatedText"]
@@ -176,28 +297,30 @@ def translate_with_libretranslate(text, source_lang="en", target_lang="tr"):
                 }.get(response.status_code, f"Hata kodu: {response.status_code}")
                 
                 print(f"LibreTranslate hatası ({url}): {error_msg}")
-                
-                # Sonraki URL'ye geç
-                CURRENT_LIBRE_URL_INDEX = (CURRENT_LIBRE_URL_INDEX + 1) % len(LIBRE_TRANSLATE_URLS)
+                libre_servers.record_failure(url, quota=response.status_code == 429)
                 update_progress_bar("error")
-                continue
         except requests.exceptions.Timeout:
             print(f"LibreTranslate zaman aşımı ({url})")
-            CURRENT_LIBRE_URL_INDEX = (CURRENT_LIBRE_URL_INDEX + 1) % len(LIBRE_TRANSLATE_URLS)
+            libre_servers.record_failure(url)
             update_progress_bar("error")
         except requests.exceptions.ConnectionError:
             print(f"LibreTranslate bağlantı hatası ({url})")
-            CURRENT_LIBRE_URL_INDEX = (CURRENT_LIBRE_URL_INDEX + 1) % len(LIBRE_TRANSLATE_URLS)
+            libre_servers.record_failure(url)
             update_progress_bar("error")
         except Exception as e:
             print(f"LibreTranslate genel hata ({url}): {str(e)}")
-            # Sonraki URL'ye geç
-            CURRENT_LIBRE_URL_INDEX = (CURRENT_LIBRE_URL_INDEX + 1) % len(LIBRE_TRANSLATE_URLS)
+            libre_servers.record_failure(url)
             update_progress_bar("error")
     
     # Tüm URL'ler başarısız olursa
     return f"[LibreTranslate erişilemez durumda. Başka bir çeviri servisi deneyin.]"
 
+def probe_libretranslate(url):
+    """Arka plan yoklaması: yalnızca LibreTranslate seçiliyken sunucuyu dener"""
+    if config['translator_service'] != 'libretranslate':
+        return None
+    return libretranslate_request(url, "test", "en", "tr", timeout=3).status_code
+
 def translate_with_argos(text, source_lang="en", target_lang="tr"):
     """Argos Translate kullanarak çeviri yapar"""
     if not text or not ARGOS_AVAILABLE:
@@ -207,48 +330,23 @@ def translate_with_argos(text, source_lang="en", target_lang="tr"):
         update_progress_bar("testing")
         
         try:
-            # Dil kodlarını doğrula (ISO 639 uyumluluğu)
-            if '-' in source_lang:  # 'zh-cn' gibi bölgesel kodlar için düzeltme
-                source_lang = source_lang.split('-')[0]
-            if '-' in target_lang:
-                target_lang = target_lang.split('-')[0]
-                
-            # Dil çiftini kontrol et
-            installed_packages = argostranslate.package.get_installed_packages()
-            from_langs = argostranslate.translate.get_installed_languages()
-            to_langs = []
-            
-            # Kaynak dili bul
-            from_lang = None
-            for lang in from_langs:
-                if lang.code == source_lang:
-                    from_lang = lang
-                    break
-            
-            if from_lang is None:
-                update_progress_bar("error")
-                return f"[Argos için kaynak dil '{source_lang}' bulunamadı]"
-            
-            # Hedef dilleri kontrol et
-            to_langs = from_lang.translations
-            to_lang = None
-            for lang in to_langs:
-                if lang.code == target_lang:
-                    to_lang = lang
-                    break
-            
-            if to_lang is None:
-                update_progress_bar("error")
-                return f"[Argos için '{source_lang}' dilinden '{target_lang}' diline çeviri paketi bulunamadı]"
-            
-            # Çeviri yap
-            translation = from_lang.get_translation(to_lang).translate(text)
+            # Cümleler paralel çevrilir; daha önce çevrilmiş cümleler önbellekten gelir
+            lookup = store = None
+            if config['translation_cache_enabled']:
+                lookup = lambda sentence: translation_cache.get('argos', source_lang, target_lang, sentence)
+                store = lambda sentence, result: translation_cache.put('argos', source_lang, target_lang, sentence, result)
+            translation = argos_batch.translate(text, source_lang, target_lang, lookup=lookup, store=store)
             update_progress_bar("success")
             return translation
-            
+        except ArgosLanguageError as e:
+            update_progress_bar("error")
+            return f"[{e}]"
         except (AttributeError, IndexError):
             # Eski yöntem ile deneyelim (API değişimi durumunda)
-            translation = argostranslate.translate.translate(text, source_lang, target_lang)
+            import argostranslate.translate
+            translation = argostranslate.translate.translate(
+                text, normalize_lang(source_lang), normalize_lang(target_lang)
+            )
             update_progress_bar("success")
             return translation
             
@@ -256,17 +354,170 @@ def translate_with_argos(text, source_lang="en", target_lang="tr"):
         update_progress_bar("error")
         return f"[Argos Çeviri Hatası: {str(e)}]"
 
-def translate_text(text, source_lang="en", target_lang="tr"):
-    """Seçilen çeviri motorunu kullanarak çeviri yapar"""
-    if config['translator_service'] == 'google':
+def preload_argos():
+    """Argos seçiliyse çeviri modelini arka planda hazırlar"""
+    if ARGOS_AVAILABLE and config['translator_service'] == 'argos':
+        argos_translations.preload(config['source_lang'], config['target_lang'])
+
+def is_translation_error(result):
+    """Çeviri fonksiyonlarının döndürdüğü "[...]" hata mesajlarını tanır"""
+    return result.startswith('[') and result.endswith(']')
+
+def use_async_client(service):
+    return async_client is not None and service in ('google', 'libretranslate')
+
+def translate_with_service(service, text, source_lang="en", target_lang="tr"):
+    """Belirtilen çeviri servisine yönlendirir"""
+    if use_async_client(service):
+        return async_client.translate(
+            service, text, source_lang, target_lang, deadline_s=config['translation_deadline_s']
+        )
+    if service == 'google':
         return translate_with_google(text, source_lang, target_lang)
-    elif config['translator_service'] == 'libretranslate':
+    elif service == 'libretranslate':
         return translate_with_libretranslate(text, source_lang, target_lang)
-    elif config['translator_service'] == 'argos':
+    elif service == 'argos':
         return translate_with_argos(text, source_lang, target_lang)
     else:
         return translate_with_google(text, source_lang, target_lang)  # Varsayılan olarak Google
 
+def race_backend(name, service, text, source_lang, target_lang, urls=None):
+    """HedgedCaller için arka uç: çevrimiçi servisler iptal edilebilir asenkron istek olarak yarışır"""
+    if use_async_client(service):
+        return (name, lambda: async_client.submit(
+            service, text, source_lang, target_lang,
+            deadline_s=config['translation_deadline_s'], urls=urls
+        ), True)
+    if urls is not None:
+        return (name, lambda: translate_with_libretranslate(text, source_lang, target_lang, urls=urls))
+    return (name, lambda: translate_with_service(service, text, source_lang, target_lang))
+
+def race_translate(service, text, source_lang, target_lang):
+    """Birincil servise istek atar; gecikirse yedek servise de atar, ilk geçerli yanıtı döner"""
+    hedge_service = config['race_hedge_service']
+    primary = race_backend(service, service, text, source_lang, target_lang)
+    if hedge_service == service == 'libretranslate':
+        # Aynı servis seçiliyse yedek istek ikinci en iyi sunucuya gider
+        urls = libre_servers.candidates()
+        backup_urls = urls[1:] + urls[:1]
+        hedge = race_backend('libretranslate (yedek)', 'libretranslate', text, source_lang, target_lang,
+                             urls=backup_urls)
+    else:
+        hedge = race_backend(hedge_service, hedge_service, text, source_lang, target_lang)
+    return hedged_caller.call(
+        primary, hedge,
+        hedge_delay_s=config['race_hedge_delay_ms'] / 1000,
+        is_valid=lambda result: bool(result) and not is_translation_error(result)
+    )
+
+def translate_text(text, source_lang="en", target_lang="tr"):
+    """Seçilen çeviri motorunu kullanarak çeviri yapar (önbellekli)"""
+    service = config['translator_service']
+    if config['translation_cache_enabled']:
+        cached = translation_cache.get(service, source_lang, target_lang, text)
+        if cached is not None:
+            return cached
+    
+    if config['race_mode']:
+        result = race_translate(service, text, source_lang, target_lang)
+    else:
+        started = time.perf_counter()
+        result = translate_with_service(service, text, source_lang, target_lang)
+        backend_latency.record(service, (time.perf_counter() - started) * 1000)
+    
+    # Hata mesajlarını önbelleğe alma
+    if config['translation_cache_enabled'] and result and not is_translation_error(result):
+        translation_cache.put(service, source_lang, target_lang, text, result)
+    return result
+
+def translate_service_batch(service, texts, source_lang, target_lang):
+    """Bir grup metni tek istekte çevirir; toplu istek yoksa ya da başarısızsa None"""
+    global translator
+    if service == 'libretranslate':
+        for url in libre_servers.candidates():
+            started = time.perf_counter()
+            try:
+                results = libretranslate_batch(http_pool, url, texts, source_lang, target_lang)
+                libre_servers.record_success(url, (time.perf_counter() - started) * 1000)
+                return results
+            except BatchTranslationError as e:
+                print(f"{e} ({url})")
+                status = getattr(e, 'status', None)
+                if status is None:
+                    # Sunucu liste desteklemiyor; tek tek gönderime düş
+                    return None
+                libre_servers.record_failure(url, quota=status == 429)
+            except Exception as e:
+                print(f"LibreTranslate toplu istek hatası ({url}): {e}")
+                libre_servers.record_failure(url)
+        return None
+    if service == 'google' and GOOGLE_AVAILABLE:
+        try:
+            return google_batch(get_translator(), texts, source_lang, target_lang)
+        except Exception as e:
+            print(f"Google toplu istek hatası: {e}")
+            translator = None
+            return None
+    return None
+
+def translate_batch(texts, source_lang="en", target_lang="tr"):
+    """Birden fazla metni mümkün olduğunca az istekle çevirir (önbellekli)
+
+    Önbellekte olmayan metinler en fazla batch_max_payload_bytes büyüklüğünde
+    gruplara paketlenip tek istekte gönderilir. Toplu istek başarısız olan
+    grubun metinleri asenkron istemci varsa aynı anda, yoksa tek tek
+    translate_text ile çevrilir.
+    """
+    service = config['translator_service']
+    results = [None] * len(texts)
+    if config['translation_cache_enabled']:
+        results = [translation_cache.get(service, source_lang, target_lang, text) for text in texts]
+    missing = [i for i, result in enumerate(results) if result is None and texts[i]]
+    
+    for batch in pack_batches([texts[i] for i in missing], config['batch_max_payload_bytes']):
+        indexes = [missing[i] for i in batch]
+        batch_texts = [texts[i] for i in indexes]
+        started = time.perf_counter()
+        translated = translate_service_batch(service, batch_texts, source_lang, target_lang)
+        if translated is None and use_async_client(service):
+            translated = async_client.translate_many(
+                service, batch_texts, source_lang, target_lang, deadline_s=config['translation_deadline_s']
+            )
+        elif translated is None:
+            translated = [translate_text(text, source_lang, target_lang) for text in batch_texts]
+        else:
+            backend_latency.record(service, (time.perf_counter() - started) * 1000)
+        for i, result in zip(indexes, translated):
+            results[i] = result
+            if config['translation_cache_enabled'] and result and not is_translation_error(result):
+                translation_cache.put(service, source_lang, target_lang, texts[i], result)
+    return [result if result is not None else "" for result in results]
+
+def translate_lines(lines, source_lang="en", target_lang="tr"):
+    """Satırları ayrı ayrı çevirir; toplu istek ya da asenkron istemciyle gönderir"""
+    service = config['translator_service']
+    if config['batch_translation'] and not config['race_mode'] and service in ('google', 'libretranslate'):
+        return translate_batch(lines, source_lang, target_lang)
+    if not use_async_client(service) or config['race_mode']:
+        return [translate_text(line, source_lang, target_lang) for line in lines]
+    
+    results = [None] * len(lines)
+    if config['translation_cache_enabled']:
+        results = [translation_cache.get(service, source_lang, target_lang, line) for line in lines]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        started = time.perf_counter()
+        translated = async_client.translate_many(
+            service, [lines[i] for i in missing], source_lang, target_lang,
+            deadline_s=config['translation_deadline_s']
+        )
+        backend_latency.record(service, (time.perf_counter() - started) * 1000)
+        for i, result in zip(missing, translated):
+            results[i] = result
+            if config['translation_cache_enabled'] and result and not is_translation_error(result):
+                translation_cache.put(service, source_lang, target_lang, lines[i], result)
+    return results
+
 # -----------------------------------------------------
 # TESSERACT KONTROLÜ
 # -----------------------------------------------------
@@ -285,15 +536,12 @@ except (TesseractNotFoundError, OSError) as e:
 # -----------------------------------------------------
 # GLOBAL DURUM DEĞİŞKENLERİ
 # -----------------------------------------------------
-easyocr_current_lang = None
 running = False
 app_running = True
 rects_visible = True
 last_text = ""
 progress_value = 0
-trocr_processor = None
-trocr_model = None
-doctr_predictor = None
+frame_detector = FrameChangeDetector(config['frame_diff_block'], config['frame_diff_tolerance'])
 
 # -----------------------------------------------------
 # TKINTER ANA PENCERE VE OVERLAY KURULUMU
@@ -309,6 +557,9 @@ root.attributes('-transparentcolor', 'black')
 canvas = tk.Canvas(root, width=sw, height=sh, bg='black', highlightthickness=0)
 canvas.place(x=0, y=0)
 
+# İşçi iş parçacıkları widget'lara doğrudan dokunmaz, güncellemeleri buraya bırakır
+ui_updates = UIUpdateQueue(root, fps=config['ui_fps'])
+
 region_rect = display_rect = source_display_rect = None
 
 # -----------------------------------------------------
@@ -377,7 +628,41 @@ def update_status_label():
         'doctr': 'DocTR'
     }.get(config.get('ocr_engine', 'tesseract'), 'Tesseract OCR')
     
-    status_label.config(text=f"OCR: {ocr_name} | Çeviri: {config['source_lang']} -> {config['target_lang']} ({service_name})")
+    status_text = f"OCR: {ocr_name} | Çeviri: {config['source_lang']} -> {config['target_lang']} ({service_name})"
+    status_text += f" | {ocr_registry.stats_text(config.get('ocr_engine', 'tesseract'), config['source_lang'])}"
+    if running:
+        status_text += f" | {frame_detector.stats_text()}"
+        if config['line_tracking']:
+            status_text += f" | {line_tracker.stats_text()}"
+        if config['translation_cache_enabled']:
+            status_text += f" | {translation_cache.stats_text()}"
+        if config['scroll_tracking'] and not config['line_tracking']:
+            status_text += f" | {scroll_tracker.stats_text()}"
+        if config['ocr_cache_enabled'] and not config['line_tracking'] and not config['scroll_tracking']:
+            status_text += f" | {ocr_cache.stats_text()}"
+        if config['jitter_filter']:
+            status_text += f" | {jitter_filter.stats_text()}"
+        if config['text_stabilization']:
+            status_text += f" | {text_stabilizer.stats_text()}"
+        if config['incremental_translation'] and not config['line_tracking']:
+            status_text += f" | {incremental_translator.stats_text()}"
+        if config['translator_service'] == 'libretranslate':
+            status_text += f" | {libre_servers.stats_text()} | {http_pool.stats_text()}"
+        if config['race_mode']:
+            status_text += f"\n{backend_latency.stats_text()} | {hedged_caller.stats_text()}"
+        status_text += f"\n{translation_pipeline.stats_text()}"
+        if config['preprocess_enabled']:
+            status_text += f"\n{preprocessor.stats_text()}"
+        if config['adaptive_interval']:
+            status_text += f" | Aralık: {capture_scheduler.interval_ms:.0f}ms"
+    status_label.config(text=status_text)
+
+def refresh_status_label():
+    """Çalışma sırasında istatistikleri periyodik olarak yeniler"""
+    if running and rects_visible:
+        update_status_label()
+    if app_running:
+        root.after(1000, refresh_status_label)
 
 # Etiketler oluştur
 draw_rectangles()
@@ -415,9 +700,13 @@ for i in range(10):  # 10 bölmeli ilerleme çubuğu
     progress_bars.append(bar)
 
 def update_progress_bar(status="testing"):
-    """İlerleme çubuğunu günceller
+    """İlerleme çubuğunu günceller (her iş parçacığından çağrılabilir)
     status: "testing" (gri), "success" (yeşil), "error" (kırmızı)
     """
+    ui_updates.post('progress', draw_progress_bar, status)
+
+def draw_progress_bar(status):
+    """İlerleme çubuğunu çizer (yalnızca ana iş parçacığında)"""
     global progress_value
     colors = {"testing": "gray", "success": "lime", "error": "red"}
     color = colors.get(status, "gray")
@@ -445,7 +734,7 @@ def update_progress_bar(status="testing"):
 # -----------------------------------------------------
 settings = tk.Toplevel(root)
 settings.title('Bölge Ayarları')
-settings.geometry('490x680')  # Daha büyük pencere
+settings.geometry('490x780')  # Daha büyük pencere
 settings.attributes('-topmost', True)
 settings.protocol('WM_DELETE_WINDOW', lambda: shutdown())
 
@@ -555,15 +844,6 @@ ocr_var = tk.StringVar(value=config.get('ocr_engine', 'tesseract'))
 tesseract_radio = ttk.Radiobutton(ocr_frame, text='Tesseract OCR', value='tesseract', variable=ocr_var)
 tesseract_radio.grid(row=0, column=0, padx=5, pady=5)
 
-# EasyOCR kullanılabilirliğini kontrol et
-EASYOCR_AVAILABLE = False
-try:
-    import easyocr
-    import numpy as np
-    EASYOCR_AVAILABLE = True
-except ImportError:
-    pass
-
 easyocr_radio = ttk.Radiobutton(
     ocr_frame, 
     text='EasyOCR' + (" (Kurulu Değil)" if not EASYOCR_AVAILABLE else ""), 
@@ -613,6 +893,7 @@ if not TROCR_AVAILABLE or not DOCTR_AVAILABLE:
 speed_frame = ttk.LabelFrame(settings, text='Çeviri Hızı (ms)')
 speed_frame.grid(row=4, column=0, columnspan=2, padx=10, pady=5, sticky='ew')
 
+ttk.Label(speed_frame, text='En uzun aralık:').grid(row=0, column=0, padx=5, sticky='w')
 speed_value = IntVar(value=config['interval_ms'])
 speed_scale = Scale(
     speed_frame, 
@@ -623,7 +904,34 @@ speed_scale = Scale(
     variable=speed_value,
     resolution=100
 )
-speed_scale.grid(row=0, column=0, padx=10, pady=5)
+speed_scale.grid(row=0, column=1, padx=10, pady=5)
+
+# Uyarlamalı tarama: aralık bölge değiştikçe en kısa, durağanken en uzun sınıra gider
+ttk.Label(speed_frame, text='En kısa aralık:').grid(row=1, column=0, padx=5, sticky='w')
+min_speed_value = IntVar(value=config['interval_min_ms'])
+min_speed_scale = Scale(
+    speed_frame, 
+    from_=50, 
+    to=2000, 
+    orient=tk.HORIZONTAL, 
+    length=300,
+    variable=min_speed_value,
+    resolution=50
+)
+min_speed_scale.grid(row=1, column=1, padx=10, pady=5)
+
+ttk.Label(speed_frame, text='CPU bütçesi (%):').grid(row=2, column=0, padx=5, sticky='w')
+cpu_budget_value = IntVar(value=config['cpu_budget_percent'])
+cpu_budget_scale = Scale(
+    speed_frame, 
+    from_=5, 
+    to=100, 
+    orient=tk.HORIZONTAL, 
+    length=300,
+    variable=cpu_budget_value,
+    resolution=5
+)
+cpu_budget_scale.grid(row=2, column=1, padx=10, pady=5)
 
 # UI kontrol düğmeleri
 control_frame = ttk.Frame(settings)
@@ -725,9 +1033,27 @@ def apply_settings():
         config['target_lang'] = target_lang_entry.get()
         config['translator_service'] = translator_var.get()
         config['interval_ms'] = speed_value.get()
+        config['interval_min_ms'] = min(min_speed_value.get(), config['interval_ms'])
+        config['cpu_budget_percent'] = cpu_budget_value.get()
+        capture_scheduler.configure(
+            config['interval_min_ms'], config['interval_ms'], config['cpu_budget_percent'] / 100
+        )
         config['ocr_engine'] = ocr_var.get()
         # cpu_workers referansını kaldırın
         
+        # Bölge veya motor değişmiş olabilir, sonraki kare mutlaka OCR'dan geçsin
+        frame_detector.reset()
+        line_tracker.reset()
+        jitter_filter.reset()
+        text_stabilizer.reset()
+        incremental_translator.reset()  # Dil ya da servis değişmiş olabilir
+        scroll_tracker.reset()
+        translation_pipeline.flush()  # Eski dil/bölge için uçuştaki çeviriyi iptal et
+        preload_ocr_engine()
+        argos_translations.invalidate()
+        preload_argos()
+        ensure_async_client()
+        
         # Etiketleri doğru konumlara yerleştir
         tl.place(x=config['display']['x'], y=config['display']['y'])
         tl.config(wraplength=config['wraplength'])
@@ -764,142 +1090,231 @@ def blink():
     if app_running:
         root.after(500, blink)
 
-# Import alanında gerekli modülleri ekleyelim (dosyanın başına)
-try:
-    import easyocr
-    import numpy as np
-    EASYOCR_AVAILABLE = True
-except ImportError:
-    EASYOCR_AVAILABLE = False
-
-# EasyOCR Reader nesnesini global olarak tanımlayalım
-easyocr_reader = None
-easyocr_current_lang = None  # Mevcut dili takip etmek için
+# OCR motorları (engine, dil) anahtarıyla sıcak tutulur; seçilen motor arka planda yüklenir
+ocr_registry = OCREngineRegistry(
+    {name: engine for name, engine in OCR_ENGINES.items() if {
+        'tesseract': True,  # Başlangıçta kurulu olduğu doğrulandı
+        'easyocr': EASYOCR_AVAILABLE,
+        'trocr': TROCR_AVAILABLE,
+        'doctr': DOCTR_AVAILABLE
+    }.get(name)},
+    max_warm=config['ocr_warm_engines'],
+    options={'tesseract': {'psm': config['tesseract_psm'], 'oem': config['tesseract_oem']}}
+)
 
-def translate_loop():
-    """Ana çeviri döngüsü"""
-    global app_running, last_text, easyocr_reader, easyocr_current_lang
-    
-    # İlk çalıştırmada EasyOCR okuyucusunu başlat
-    if easyocr_current_lang != config['source_lang']:
+def preload_ocr_engine(engine=None):
+    """Seçili OCR motorunu arka planda hazırlar"""
+    ocr_registry.preload(engine or config.get('ocr_engine', 'tesseract'), config['source_lang'])
+
+# Radyo düğmesiyle seçilen motor, ayarlar kaydedilmeden önce ısınmaya başlasın
+ocr_var.trace_add('write', lambda *_: preload_ocr_engine(ocr_var.get()))
+
+def ocr_image(img):
+    """Seçilen OCR motoruyla görüntüdeki metni çıkarır"""
+    ocr_engine = config.get('ocr_engine', 'tesseract')
+    # Motor henüz yükleniyorsa OCR iş parçacığı hazır olana kadar bekler;
+    # okuma sürerken motor havuzdan çıkarılsa bile kapatılmaz
+    with ocr_registry.acquire(ocr_engine, config['source_lang']) as engine:
+        if engine is None:
+            return ""
         try:
-            print(f"EasyOCR dil güncellemesi: {config['source_lang']}")
-            # num_workers parametresini kaldır
-            easyocr_reader = easyocr.Reader([config['source_lang']], gpu=False)
-            easyocr_current_lang = config['source_lang']
+            return engine.read(img)
         except Exception as e:
-            print(f"EasyOCR dil değiştirme hatası: {e}")
+            print(f"{ocr_engine} okuma hatası: {e}")
+            return ""
+
+# Satır satır OCR: parmak izi değişmeyen satırlar önceki okumadan gelir
+line_tracker = LineTracker(ocr_image)
+
+# OCR öncesi ön işleme: gri tonlama, kontrast, eşik, kırpma, büyütme
+preprocessor = Preprocessor(
+    grayscale=config['preprocess_grayscale'],
+    normalize=config['preprocess_normalize'],
+    threshold=config['preprocess_threshold'],
+    threshold_window=config['preprocess_threshold_window'],
+    threshold_offset=config['preprocess_threshold_offset'],
+    upscale=config['preprocess_upscale'],
+    # Kaydırma takibi satır konumlarını karşılaştırır; kırpma konumları kaydırırdı
+    crop=config['preprocess_crop'] and not config['scroll_tracking'],
+    crop_padding=config['preprocess_crop_padding']
+)
+
+def preprocess_stage(frame):
+    """Boru hattı ön işleme aşaması: NumPy kareyi OCR'a hazır PIL görüntüsüne çevirir"""
+    if config['preprocess_enabled']:
+        frame = preprocessor.process(frame)
+        if frame is None:  # Karede metin yok, OCR'a gerek yok
+            text_stabilizer.reset()
+            return None
+    # Kare bu aşamaya ait bir kopya olduğundan PIL görüntüsü ona sarılabilir
+    return Image.fromarray(frame)
+
+# Parmak izi -> OCR metni (tekrar eden menü/diyalog ekranları için)
+ocr_cache = OCRResultCache(config['ocr_cache_size'], config['ocr_cache_max_kb'] * 1024)
+
+def cached_ocr_image(img):
+    """Kare daha önce aynı motor ve dille okunduysa OCR'ı atlar"""
+    if not config['ocr_cache_enabled']:
+        return ocr_image(img)
+    key = ocr_cache.key(img, config.get('ocr_engine', 'tesseract'), config['source_lang'])
+    txt = ocr_cache.get(key)
+    if txt is None:
+        txt = ocr_image(img)
+        # Boş sonuç motorun henüz hazır olmamasından da kaynaklanabilir; saklama
+        if txt:
+            ocr_cache.put(key, txt)
+    return txt
+
+# OCR titreşimi: aynı metnin küçük farklarla okunması yeni çeviri tetiklemesin
+jitter_filter = JitterFilter(config['jitter_similarity'], config['jitter_history'])
+
+# Daktilo efekti: metin büyürken her ara hali çevirme, oturunca bir kez çevir
+text_stabilizer = TextStabilizer(
+    config['stabilize_frames'],
+    config['stabilize_ms'],
+    config['provisional_interval_ms'] if config['provisional_translation'] else 0,
+    threshold=config['jitter_similarity']
+)
+
+# Kayan bölgelerde önceki okumayı kaydırıp yalnızca yeni şeridi OCR'lar
+scroll_tracker = ScrollTracker(ocr_image, max_shift_ratio=config['scroll_max_shift_ratio'])
+
+def ocr_stage(img):
+    """Boru hattı OCR aşaması: metin değiştiyse çeviri aşamasına iletir"""
+    global last_text
+    if config['line_tracking']:
+        txt = "\n".join(line_tracker.read_lines(img))
+    elif config['scroll_tracking']:
+        txt = scroll_tracker.read(img)
+    else:
+        txt = cached_ocr_image(img)
     
-    last_check_time = time.time()  # Son işlem zamanını takip et
-    min_interval = 0.1  # Minimum işlem aralığı (saniye)
+    if not txt or not running:
+        text_stabilizer.reset()
+        return None
+    if config['text_stabilization']:
+        if txt == last_text and not text_stabilizer.pending:
+            return None
+        txt, final = text_stabilizer.observe(txt)
+        if txt is None:
+            return None  # Metin hâlâ büyüyor
+        if not final:
+            # Geçici çeviri: titreşim süzgecine ve last_text'e dokunmaz
+            ui_updates.post('source_text', show_source_text, txt)
+            return txt
+    
+    # Metin değişmediyse çeviri aşamasına gönderme
+    if txt == last_text:
+        return None
+    if config['jitter_filter'] and not jitter_filter.is_new(txt):
+        return None
+    last_text = txt
+    ui_updates.post('source_text', show_source_text, txt)  # Kaynak metni güncelle
+    return txt
+
+# Önceki okumanın devamı olan metinde yalnızca eklenen satırlar çevrilir;
+# satırlar toplu istek/asenkron istemciyle ve satır başına önbellekle çevrilir
+incremental_translator = IncrementalTranslator(
+    lambda lines: translate_lines(lines, config['source_lang'], config['target_lang']),
+    is_valid=lambda result: not is_translation_error(result),
+    threshold=config['jitter_similarity']
+)
+
+def translate_stage(txt):
+    """Boru hattı çeviri aşaması"""
+    update_progress_bar("testing")
+    if config['line_tracking']:
+        # Satırlar ayrı çevrilir; değişmeyen satırlar çeviri önbelleğinden gelir
+        return "\n".join(translate_lines(txt.split("\n"), config['source_lang'], config['target_lang']))
+    if config['incremental_translation']:
+        return incremental_translator.translate(txt)
+    return translate_text(txt, config['source_lang'], config['target_lang'])
+
+def show_source_text(txt):
+    if running:
+        sl.config(text=txt)
+
+def show_translation(trans_text):
+    # Durdurulduktan sonra gelen eski sonuçları gösterme
+    if not running:
+        return
+    if trans_text:
+        tl.config(text=trans_text)  # Çeviriyi göster
+        update_progress_bar("success")
+    else:
+        update_progress_bar("error")
+
+def render_translation(trans_text):
+    """Boru hattının son aşaması: çeviriyi ana döngüde gösterilmek üzere sıraya koyar"""
+    ui_updates.post('translation', show_translation, trans_text)
+
+# OCR ve çeviri ayrı iş parçacıklarında; yavaş bir çeviri yeni kareleri bekletmez
+translation_pipeline = Pipeline(
+    [
+        PipelineStage('Ön işleme', preprocess_stage, maxsize=config['pipeline_queue_size']),
+        PipelineStage('OCR', ocr_stage, maxsize=config['pipeline_queue_size']),
+        PipelineStage('Çeviri', translate_stage, maxsize=config['pipeline_queue_size'])
+    ],
+    sink=render_translation
+)
+
+def translation_superseded():
+    """Çeviri aşamasında işlenen metin flush ile geçersiz kılındıysa True"""
+    return translation_pipeline.stages[-1].current_superseded()
+
+def cancel_in_flight_translations():
+    """flush sırasında asenkron istemcideki uçuştaki istekleri iptal eder"""
+    if async_client is not None:
+        async_client.cancel_pending()
+
+translation_pipeline.add_flush_hook(cancel_in_flight_translations)
+
+# Yakalama aralığı değişim hızına, boru hattı gecikmesine ve CPU bütçesine göre ayarlanır
+capture_scheduler = AdaptiveScheduler(
+    config['interval_min_ms'], config['interval_ms'], config['cpu_budget_percent'] / 100
+)
+
+# Yakalama arka ucu tek bir tamponu yeniden kullanır; yalnızca değişen kareler kopyalanır
+screen_capture = create_capture(config['capture_backend'])
+print(f"Ekran yakalama arka ucu: {screen_capture.name}")
+
+def translate_loop():
+    """Ana yakalama döngüsü: kareleri yakalar ve boru hattına gönderir"""
+    global app_running
     
     while app_running:
+        interval_ms = config['interval_ms']
         if running:
-            current_time = time.time()
-            # Minimum aralıktan daha kısa süre geçtiyse bekle
-            if current_time - last_check_time < min_interval:
-                time.sleep(0.01)  # Kısa bir süre bekle
-                continue
-
             try:
                 # Ekran görüntüsü al
-                img = pyautogui.screenshot(region=(
-                    config['region']['x'], 
-                    config['region']['y'],
-                    config['region']['width'], 
-                    config['region']['height']
-                ))
+                started = time.perf_counter()
+                frame = screen_capture.grab(config['region'])
                 
-                # Seçilen OCR motoruna göre metin çıkar
-                txt = ""
-                ocr_engine = config.get('ocr_engine', 'tesseract')
-
-                if ocr_engine == 'easyocr' and EASYOCR_AVAILABLE and easyocr_reader:
-                    # EasyOCR ile metni çıkar
-                    try:
-                        img_array = np.array(img)
-                        results = easyocr_reader.readtext(img_array, detail=0)
-                        txt = " ".join(results).strip()
-                    except Exception as e:
-                        print(f"EasyOCR okuma hatası: {e}")
-                        txt = ""  # Hata durumunda boş metin döndür, otomatik geçiş yok
-                        
-                elif ocr_engine == 'trocr' and TROCR_AVAILABLE:
-                    # TrOCR ile metni çıkar
-                    global trocr_processor, trocr_model
-                    
-                    try:
-                        # Model ve işlemci yüklü değilse yükle (ilk kullanımda)
-                        if trocr_processor is None or trocr_model is None:
-                            trocr_processor = TrOCRProcessor.from_pretrained("microsoft/trocr-base-handwritten")
-                            trocr_model = VisionEncoderDecoderModel.from_pretrained("microsoft/trocr-base-handwritten")
-                            print("TrOCR modeli yüklendi")
-                        
-                        # Görüntüyü işle
-                        pixel_values = trocr_processor(images=img, return_tensors="pt").pixel_values
-                        generated_ids = trocr_model.generate(pixel_values)
-                        generated_text = trocr_processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
-                        txt = generated_text.strip()
-                    except Exception as e:
-                        print(f"TrOCR okuma hatası: {e}")
-                        txt = ""
-                        
-                elif ocr_engine == 'doctr' and DOCTR_AVAILABLE:
-                    # DocTR ile metni çıkar
-                    global doctr_predictor
-                    
-                    try:
-                        # Tahmin edici yüklü değilse yükle (ilk kullanımda)
-                        if doctr_predictor is None:
-                            doctr_predictor = ocr_predictor(pretrained=True)
-                            print("DocTR modeli yüklendi")
-                        
-                        # Mutlak yol kullanarak görüntüyü kaydet
-                        temp_img_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'temp_ocr_img.png'))
-                        img.save(temp_img_path)
-                        print(f"Görüntü kaydedildi: {temp_img_path}")
-                        
-                        # DocTR belge işleme - normalleştirilmiş yol kullanarak
-                        doc = DocumentFile.from_images([temp_img_path])
-                        result = doctr_predictor(doc)
-                        
-                        # Sonuçları metin olarak çıkar
-                        txt = result.render()
-                        print(f"DocTR sonucu: {txt}")
-                        
-                        # Geçici dosyayı sil
-                        try:
-                            os.remove(temp_img_path)
-                        except Exception as e:
-                            print(f"Geçici dosya silinemedi: {e}")
-                    except Exception as e:
-                        print(f"DocTR okuma hatası: {e}")
-                        txt = ""
+                # Kare bir öncekiyle aynıysa pahalı OCR adımını atla
+                changed = frame_detector.has_changed(frame)
+                # Oturmayı bekleyen metin varsa durağan kareler de okunur (OCR önbelleğinden gelir)
+                if config['text_stabilization'] and text_stabilizer.pending:
+                    changed = True
+                if changed:
+                    translation_pipeline.submit(frame.copy())
+                capture_ms = (time.perf_counter() - started) * 1000
                 
-                # Metin değiştiyse ve boş değilse çeviri yap
-                if txt and txt != last_text:
-                    sl.config(text=txt)  # Kaynak metni güncelle
-                    
-                    # Çeviri yap
-                    update_progress_bar("testing")
-                    trans_text = translate_text(txt, config['source_lang'], config['target_lang'])
-                    
-                    if trans_text:
-                        tl.config(text=trans_text)  # Çeviriyi göster
-                        update_progress_bar("success")
-                    else:
-                        update_progress_bar("error")
-                    
-                    last_text = txt  # Son metni güncelle
-                    last_check_time = time.time()  # Son işlem zamanını güncelle
+                if config['adaptive_interval']:
+                    interval_ms = capture_scheduler.next_interval_ms(
+                        changed, capture_ms, translation_pipeline.slowest_latency_ms()
+                    )
             except Exception as e:
                 print(f"Çeviri döngüsünde hata: {e}")
                 update_progress_bar("error")
                 
         # CPU yükünü azaltmak için daha uzun aralıklarla çalıştır
-        time.sleep(config['interval_ms'] / 1000)
+        time.sleep(interval_ms / 1000)
 
 # Çeviri işlemini arka planda başlat
+preload_ocr_engine()
+preload_argos()
+libre_servers.start_probing(probe_libretranslate, interval_s=config['libre_probe_interval_s'])
+translation_pipeline.start()
 threading.Thread(target=translate_loop, daemon=True).start()
 
 # -----------------------------------------------------
@@ -922,6 +1337,12 @@ def stop():
     tl.config(text='')  # Çeviri metnini temizle
     sl.config(text='')  # Kaynak metni temizle
     last_text = ""      # Son metni sıfırla
+    frame_detector.reset()
+    jitter_filter.reset()
+    text_stabilizer.reset()
+    incremental_translator.reset()
+    scroll_tracker.reset()
+    translation_pipeline.flush()  # Bekleyen ve uçuştaki sonuçları iptal et
     if rects_visible:
         status_label.config(text='')
 
@@ -929,19 +1350,37 @@ def shutdown():
     """Programı kapat"""
     global app_running
     app_running = False
+    ui_updates.stop()
     save_settings(config)
+    translation_pipeline.stop()
+    libre_servers.stop_probing()
+    hedged_caller.shutdown()
+    argos_batch.shutdown()
+    if async_client is not None:
+        async_client.close()
+    translation_cache.close()
+    http_pool.close()
     root.destroy()
     os._exit(0)
 
-# Kısayol tuşları
-keyboard.add_hotkey('1', start)  # Başlat
-keyboard.add_hotkey('2', stop)   # Durdur
+# Kısayol tuşları (keyboard kendi iş parçacığında çağırır, ana döngüye aktar)
+keyboard.add_hotkey('1', lambda: ui_updates.post('hotkey', start))  # Başlat
+keyboard.add_hotkey('2', lambda: ui_updates.post('hotkey', stop))   # Durdur
 
 # Yanıp sönme animasyonunu başlat
 blink()
+refresh_status_label()
+ui_updates.start()
 
 # Ayarlar penceresini başlat
 settings.update()
 
+# Ana döngü ilk kez boşaldığında arayüz görünür durumdadır
+def report_startup():
+    startup_timer.mark('arayüz')
+    print(startup_timer.summary(f"{config.get('ocr_engine', 'tesseract')}/{config['translator_service']}"))
+
+root.after_idle(report_startup)
+
 # Kullanıcı arayüzünü başlat
 root.mainloop()
@@ -0,0 +1,185 @@
+"""
+Argos Translate (çevrimdışı) çeviri nesnelerinin önbelleği.
+
+Dil çifti çözümlemesi (yüklü dilleri listeleme, kaynak/hedef dili bulma,
+`get_translation` ile model hattını kurma) pahalıdır. Bu modül çözümlenmiş
+çeviri nesnesini (kaynak, hedef) çifti başına bir kez oluşturur ve ayarlar
+değişene ya da paket kurulana kadar tekrar kullanır. Uzun metinler
+cümlelere bölünüp birden fazla çekirdekte çevrilir.
+"""
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?…。！？])\s+')
+
+
+class ArgosLanguageError(LookupError):
+    """İstenen dil ya da dil çifti yüklü değil"""
+
+
+def normalize_lang(code):
+    # 'zh-cn' gibi bölgesel kodlar için düzeltme (ISO 639 uyumluluğu)
+    return code.split('-')[0] if '-' in code else code
+
+
+def resolve_translation(source_lang, target_lang):
+    """Yüklü paketlerden (kaynak, hedef) çeviri nesnesini bulur"""
+    import argostranslate.translate
+
+    source_lang = normalize_lang(source_lang)
+    target_lang = normalize_lang(target_lang)
+    from_lang = next(
+        (lang for lang in argostranslate.translate.get_installed_languages() if lang.code == source_lang),
+        None
+    )
+    if from_lang is None:
+        raise ArgosLanguageError(f"Argos için kaynak dil '{source_lang}' bulunamadı")
+    to_lang = next((lang for lang in from_lang.translations if lang.code == target_lang), None)
+    if to_lang is None:
+        raise ArgosLanguageError(
+            f"Argos için '{source_lang}' dilinden '{target_lang}' diline çeviri paketi bulunamadı"
+        )
+    return from_lang.get_translation(to_lang)
+
+
+class ArgosTranslationCache:
+    def __init__(self, resolver=resolve_translation):
+        self.resolver = resolver
+        self._translations = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def get(self, source_lang, target_lang):
+        """Çeviri nesnesini döner; arka planda yükleniyorsa bitmesini bekler"""
+        key = (source_lang, target_lang)
+        with self._lock:
+            translation = self._translations.get(key)
+            if translation is not None:
+                return translation
+            event = self._loading.get(key)
+        if event is not None:
+            event.wait()
+            with self._lock:
+                translation = self._translations.get(key)
+            if translation is not None:
+                return translation
+        translation = self.resolver(source_lang, target_lang)
+        with self._lock:
+            self._translations[key] = translation
+        return translation
+
+    def preload(self, source_lang, target_lang):
+        """Çeviri nesnesini arka planda hazırlar"""
+        key = (source_lang, target_lang)
+        with self._lock:
+            if key in self._translations or key in self._loading:
+                return
+            event = self._loading[key] = threading.Event()
+
+        def load():
+            try:
+                translation = self.resolver(source_lang, target_lang)
+                with self._lock:
+                    self._translations[key] = translation
+                print(f"Argos çeviri modeli yüklendi: {source_lang} -> {target_lang}")
+            except Exception as e:
+                print(f"Argos çeviri modeli yüklenemedi ({source_lang} -> {target_lang}): {e}")
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+                event.set()
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def invalidate(self):
+        """Ayar değişikliği ya da paket kurulumundan sonra çağrılmalı"""
+        with self._lock:
+            self._translations.clear()
+
+
+# -----------------------------------------------------
+# CÜMLE BAZLI PARALEL ÇEVİRİ
+# -----------------------------------------------------
+def resolve_workers(cpu_workers):
+    """cpu_workers ayarını iş parçacığı sayısına çevirir (0 = tüm çekirdekler)"""
+    cpu_workers = int(cpu_workers)
+    return max(1, os.cpu_count() or 1) if cpu_workers <= 0 else cpu_workers
+
+
+def split_segments(text):
+    """Metni satır ve cümlelere böler.
+
+    (parçalar, düzen) döner; düzen her satırdaki cümle sayısıdır ve
+    `join_segments` ile özgün satır yapısı geri kurulur.
+    """
+    segments = []
+    layout = []
+    for line in text.split("\n"):
+        sentences = [part for part in _SENTENCE_END_RE.split(line.strip()) if part]
+        segments.extend(sentences)
+        layout.append(len(sentences))
+    return segments, layout
+
+
+def join_segments(translated, layout):
+    lines = []
+    position = 0
+    for count in layout:
+        lines.append(" ".join(translated[position:position + count]))
+        position += count
+    return "\n".join(lines)
+
+
+class ArgosBatchTranslator:
+    """Metni cümlelere bölüp gruplar halinde paralel çevirir, sırayı korur.
+
+    Argos'un arka ucu CTranslate2 çeviri sırasında GIL'i bıraktığından iş
+    parçacıkları birden fazla çekirdeği kullanır. Süreç havuzu yerine iş
+    parçacığı kullanılır: Windows'ta her yeni süreç ana betiği (ve Tk
+    arayüzünü) baştan çalıştırırdı.
+    """
+
+    def __init__(self, translations, workers=1):
+        self.translations = translations
+        self.workers = max(1, int(workers))
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='argos')
+            return self._executor
+
+    def translate(self, text, source_lang, target_lang, lookup=None, store=None):
+        """Metni çevirir. `lookup(cümle)` / `store(cümle, çeviri)` cümle önbelleğidir"""
+        segments, layout = split_segments(text)
+        translated = [lookup(segment) if lookup else None for segment in segments]
+        missing = [i for i, result in enumerate(translated) if result is None]
+        if missing:
+            translation = self.translations.get(source_lang, target_lang)
+            batch_count = min(self.workers, len(missing))
+            if batch_count == 1:
+                results = [translation.translate(segments[i]) for i in missing]
+            else:
+                # Ardışık gruplar: her iş parçacığı bir grubu sırayla çevirir
+                size = -(-len(missing) // batch_count)
+                batches = [missing[i:i + size] for i in range(0, len(missing), size)]
+                futures = [
+                    self._pool().submit(lambda batch: [translation.translate(segments[i]) for i in batch], batch)
+                    for batch in batches
+                ]
+                results = [result for future in futures for result in future.result()]
+            for i, result in zip(missing, results):
+                translated[i] = result
+                if store:
+                    store(segments[i], result)
+        return join_segments(translated, layout)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
@@ -0,0 +1,211 @@
+"""
+Çevrimiçi çeviri servisleri için asyncio tabanlı istemci.
+
+Kendi olay döngüsünü bir arka plan iş parçacığında çalıştırır. Senkron
+kod (ör. boru hattının çeviri aşaması) `translate` / `translate_many` ile
+istek gönderir; birçok satırın çevirisi tek iş parçacığında aynı anda
+uçuşta olabilir. Yeniden denemeler `asyncio.sleep` ile bekler, her istek
+bir son tarihe (deadline) tabidir ve iptal edilebilir.
+
+LibreTranslate istekleri httpx.AsyncClient ile gönderilir; httpx en az
+startup.ASYNC_HTTPX_MIN_VERSION olmalıdır (googletrans==4.0.0-rc1'in
+sabitlediği 0.13 sürümünde istemci kullanılmaz, senkron yola düşülür). Google için googletrans'ın asenkron
+sürümü varsa doğrudan beklenir, yoksa senkron çağrı sınırlı sayıda
+iş parçacığında yürütülür. Sunucu başına istek/bağlantı sayıları
+`host_stats` ile HTTPSessionPool'unkiyle aynı biçimde raporlanır;
+`on_progress` senkron yoldaki ilerleme çubuğu güncellemelerini karşılar.
+"""
+import asyncio
+import inspect
+import threading
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+
+class AsyncTranslationClient:
+    def __init__(self, libre_servers, translator_factory, max_in_flight=8, retries=3, retry_delay_s=1.0,
+                 on_progress=None):
+        self.libre_servers = libre_servers
+        self.translator_factory = translator_factory
+        self.on_progress = on_progress or (lambda status: None)
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.retries = max(1, int(retries))
+        self.retry_delay_s = retry_delay_s
+        self._translator = None
+        self._client = None
+        self._semaphore = None
+        self._pending = set()  # Uçuştaki concurrent.futures.Future nesneleri
+        self._pending_lock = threading.Lock()
+        self._host_counts = {}  # sunucu -> [istek sayısı, açılan bağlantı sayısı]
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name='async-translate', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._ready.set()
+        # İstemciyi (SSL bağlamı vb.) ilk çeviriden önce hazırla
+        self._loop.call_soon(self._http)
+        self._loop.run_forever()
+
+    def _http(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(headers={
+                "Accept": "application/json",
+                "User-Agent": "OCRTranslator/1.0"
+            })
+        return self._client
+
+    def _count(self, url, connections=0, requests_made=0):
+        parts = urlsplit(url)
+        counts = self._host_counts.setdefault(f"{parts.scheme}://{parts.netloc}", [0, 0])
+        counts[0] += requests_made
+        counts[1] += connections
+
+    def _connection_trace(self, url):
+        """httpcore izleme kancası: yalnızca yeni açılan TCP bağlantılarını sayar"""
+        async def trace(event_name, info):
+            if event_name == 'connection.connect_tcp.complete':
+                self._count(url, connections=1)
+        return trace
+
+    def host_stats(self):
+        """{sunucu: (istek sayısı, açılan bağlantı sayısı)}"""
+        return {host: tuple(counts) for host, counts in list(self._host_counts.items())}
+
+    # -----------------------------------------------------
+    # SERVİSLER
+    # -----------------------------------------------------
+    async def libretranslate(self, text, source_lang, target_lang, request_timeout=8, urls=None):
+        payload = {
+            "q": text,
+            "source": source_lang,
+            "target": target_lang,
+            "format": "text",
+            "api_key": ""
+        }
+        for url in urls or self.libre_servers.candidates():
+            started = time.perf_counter()
+            self.on_progress("testing")
+            try:
+                async with self._semaphore:
+                    self._count(url, requests_made=1)
+                    response = await self._http().post(
+                        url, data=payload, timeout=request_timeout,
+                        extensions={'trace': self._connection_trace(url)}
+                    )
+            except (httpx.HTTPError, OSError) as e:
+                print(f"LibreTranslate bağlantı hatası ({url}): {e}")
+                self.libre_servers.record_failure(url)
+                self.on_progress("error")
+                continue
+            except Exception as e:
+                # Beklenmeyen hata (ör. uyumsuz httpx sürümü) tüm çeviriyi düşürmesin
+                print(f"LibreTranslate genel hata ({url}): {e}")
+                self.libre_servers.record_failure(url)
+                self.on_progress("error")
+                continue
+            if response.status_code == 200:
+                self.libre_servers.record_success(url, (time.perf_counter() - started) * 1000)
+                self.on_progress("success")
+                result = response.json()
+                if "translatedText" in result:
+                    return result["translatedText"]
+                elif "translation" in result:
+                    return result["translation"]
+                return str(result)
+            print(f"LibreTranslate hatası ({url}): {response.status_code}")
+            self.libre_servers.record_failure(url, quota=response.status_code == 429)
+            self.on_progress("error")
+        return "[LibreTranslate erişilemez durumda. Başka bir çeviri servisi deneyin.]"
+
+    async def google(self, text, source_lang, target_lang):
+        last_error = None
+        for attempt in range(self.retries):
+            try:
+                if self._translator is None:
+                    self._translator = self.translator_factory()
+                async with self._semaphore:
+                    if inspect.iscoroutinefunction(self._translator.translate):
+                        result = await self._translator.translate(text, src=source_lang, dest=target_lang)
+                    else:
+                        result = await asyncio.to_thread(
+                            self._translator.translate, text, src=source_lang, dest=target_lang
+                        )
+                return result.text
+            except Exception as e:
+                last_error = e
+                self._translator = None  # Yeni çevirmen nesnesi oluştur
+                if attempt < self.retries - 1:
+                    # Bekleme olay döngüsünü durdurmaz; diğer istekler sürer
+                    await asyncio.sleep(self.retry_delay_s)
+        return f"[Çeviri Hatası: {str(last_error)}]"
+
+    async def _translate(self, service, text, source_lang, target_lang, deadline_s, urls=None):
+        if not text:
+            return ""
+        if service == 'libretranslate':
+            coro = self.libretranslate(text, source_lang, target_lang, urls=urls)
+        else:
+            coro = self.google(text, source_lang, target_lang)
+        try:
+            return await asyncio.wait_for(coro, timeout=deadline_s)
+        except asyncio.TimeoutError:
+            return f"[Çeviri zaman aşımı ({deadline_s:.0f} sn)]"
+
+    async def _translate_many(self, service, texts, source_lang, target_lang, deadline_s):
+        return await asyncio.gather(*(
+            self._translate(service, text, source_lang, target_lang, deadline_s) for text in texts
+        ))
+
+    # -----------------------------------------------------
+    # SENKRON ARAYÜZ
+    # -----------------------------------------------------
+    def _track(self, coro):
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._untrack)
+        return future
+
+    def _untrack(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def submit(self, service, text, source_lang, target_lang, deadline_s=10.0, urls=None):
+        """concurrent.futures.Future döner; `cancel()` uçuştaki isteği iptal eder.
+
+        `urls` verilirse LibreTranslate sunucuları bu sırayla denenir.
+        """
+        return self._track(self._translate(service, text, source_lang, target_lang, deadline_s, urls))
+
+    def translate(self, service, text, source_lang, target_lang, deadline_s=10.0):
+        """İptal edilirse concurrent.futures.CancelledError fırlatır"""
+        return self.submit(service, text, source_lang, target_lang, deadline_s).result()
+
+    def translate_many(self, service, texts, source_lang, target_lang, deadline_s=10.0):
+        """Tüm metinleri aynı anda gönderir, sonuçları aynı sırayla döner"""
+        return self._track(
+            self._translate_many(service, list(texts), source_lang, target_lang, deadline_s)
+        ).result()
+
+    def cancel_pending(self):
+        """Uçuştaki tüm istekleri iptal eder (ör. dil ya da bölge değişti); iptal edilen sayıyı döner"""
+        with self._pending_lock:
+            pending = list(self._pending)
+        return sum(1 for future in pending if future.cancel())
+
+    def close(self):
+        async def shutdown():
+            if self._client is not None:
+                await self._client.aclose()
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=2)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,81 @@
+"""
+Birden fazla satırı tek ağ isteğinde çevirmek için yardımcılar.
+
+LibreTranslate'in /translate uç noktası `q` alanında metin listesi kabul
+eder. googletrans `Translator.translate` liste alsa da her öğe için ayrı
+istek gönderir; bu yüzden Google'a satırlar satır sonlarıyla birleştirilmiş
+tek metin olarak gönderilir ve yanıt yeniden satırlara bölünür. Satırlar en
+fazla `max_bytes` büyüklüğünde gruplara paketlenir.
+"""
+
+
+class BatchTranslationError(Exception):
+    """Toplu istek başarısız oldu ya da eksik/bozuk yanıt döndü"""
+
+
+def pack_batches(texts, max_bytes=4000, max_items=50):
+    """Metin indekslerini yük boyutu sınırını aşmayan gruplara böler.
+
+    Tek başına sınırı aşan bir metin kendi grubunda gönderilir.
+    """
+    batches = []
+    current = []
+    current_bytes = 0
+    for i, text in enumerate(texts):
+        size = len(text.encode('utf-8'))
+        if current and (current_bytes + size > max_bytes or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            current_bytes = 0
+        current.append(i)
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def libretranslate_batch(http_pool, url, texts, source_lang, target_lang, timeout=8):
+    """Metin listesini tek bir LibreTranslate isteğinde çevirir.
+
+    Hata durumunda BatchTranslationError fırlatılır; `status` özniteliği
+    HTTP durum kodunu taşır.
+    """
+    payload = {
+        "q": list(texts),
+        "source": source_lang,
+        "target": target_lang,
+        "format": "text",
+        "api_key": ""
+    }
+    headers = {
+        "Accept": "application/json",
+        "User-Agent": "OCRTranslator/1.0"
+    }
+    response = http_pool.post(url, json=payload, headers=headers, timeout=timeout)
+    if response.status_code != 200:
+        error = BatchTranslationError(f"LibreTranslate toplu istek hatası: {response.status_code}")
+        error.status = response.status_code
+        raise error
+    result = response.json().get("translatedText")
+    if not isinstance(result, list) or len(result) != len(texts):
+        raise BatchTranslationError("LibreTranslate toplu yanıtı beklenen biçimde değil")
+    return result
+
+
+def google_batch(translator, texts, source_lang, target_lang):
+    """Metin listesini googletrans ile tek istekte çevirir.
+
+    Metinler satır sonlarıyla birleştirilir. Metinlerden biri satır sonu
+    içeriyorsa ya da yanıtın satır sayısı tutmazsa BatchTranslationError
+    fırlatılır; çağıran metinleri tek tek çevirmeye düşer.
+    """
+    texts = list(texts)
+    if any("\n" in text for text in texts):
+        raise BatchTranslationError("Google toplu isteği: metin satır sonu içeriyor")
+    result = translator.translate("\n".join(texts), src=source_lang, dest=target_lang)
+    lines = result.text.split("\n")
+    if len(lines) != len(texts):
+        raise BatchTranslationError(
+            f"Google toplu yanıtı {len(texts)} yerine {len(lines)} satır döndü"
+        )
+    return [line.strip() for line in lines]
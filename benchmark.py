@@ -0,0 +1,1006 @@
+#!/usr/bin/env python3
+"""
+Ekran ve Tkinter gerektirmeyen performans ölçümleri.
+
+Kullanım:
+    python benchmark.py doctr-input [--frames 200] [--width 800] [--height 300]
+    python benchmark.py ocr-engines [--engines tesseract,easyocr] [--lang en] [--frames 20]
+    python benchmark.py libre-servers [--requests 100]
+    python benchmark.py argos [--source en] [--target tr] [--calls 50]
+    python benchmark.py batch [--backend libretranslate|google] [--lines 200] [--max-bytes 4000]
+    python benchmark.py capture [--backends mss,pyautogui] [--frames 300] [--width 800] [--height 300]
+    python benchmark.py preprocess [--frames 200] [--upscale 2] [--threshold] [--engine tesseract]
+    python benchmark.py pipeline [--frames-dir kayıtlar/] [--engines tesseract,truth]
+                                 [--backends libretranslate,argos] [--output sonuç.json]
+    python benchmark.py startup [--repeat 3]
+    python benchmark.py scroll [--frames 100] [--step 20] [--engine tesseract]
+    python benchmark.py check [--only frame-change]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from PIL import Image, ImageDraw
+
+
+# -----------------------------------------------------
+# YARDIMCILAR
+# -----------------------------------------------------
+def synthetic_frame(width=800, height=300, text="The quick brown fox jumps over the lazy dog.", lines=4):
+    """Yakalanmış bir altyazı bölgesine benzeyen sentetik kare üretir"""
+    img = Image.new('RGB', (width, height), (20, 20, 30))
+    draw = ImageDraw.Draw(img)
+    line_height = max(12, height // (lines + 1))
+    for i in range(lines):
+        draw.text((10, 10 + i * line_height), f"{i + 1}. {text}", fill=(240, 240, 240))
+    return img
+
+
+def time_per_call(func, repeat):
+    """func'ı repeat kez çalıştırır, çağrı başına ortalama milisaniyeyi döner"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def latency_summary(samples):
+    """Milisaniye örneklerinden yüzdelikler (JSON çıktısı için)"""
+    samples = sorted(samples)
+    if not samples:
+        return None
+
+    def pick(q):
+        return round(samples[min(len(samples) - 1, int(round(q * (len(samples) - 1))))], 3)
+
+    return {
+        'count': len(samples),
+        'mean': round(sum(samples) / len(samples), 3),
+        'p50': pick(0.50),
+        'p90': pick(0.90),
+        'p99': pick(0.99),
+        'max': round(samples[-1], 3),
+    }
+
+
+def peak_rss_mb():
+    """Sürecin şimdiye kadarki en yüksek yerleşik belleği (MB); ölçülemezse None"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return round(psutil.Process().memory_info().peak_wset / 2 ** 20, 1)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt cinsinden döner
+    return round(peak / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10), 1)
+
+
+def print_row(name, ms_per_frame, baseline_ms=None):
+    line = f"  {name:<32} {ms_per_frame:8.3f} ms/kare"
+    if baseline_ms:
+        line += f"  ({baseline_ms / ms_per_frame:.1f}x)" if ms_per_frame else ""
+    print(line)
+
+
+# -----------------------------------------------------
+# DOCTR GİRDİSİ
+# -----------------------------------------------------
+def bench_doctr_input(args):
+    """Eski geçici PNG yolu ile bellekten NumPy aktarımını karşılaştırır.
+
+    Tahmin edicinin kendisi iki yolda aynıdır; yalnızca görüntünün
+    DocTR'a ulaşana kadarki maliyeti ölçülür.
+    """
+    import numpy as np
+    try:
+        from doctr.io import DocumentFile
+    except ImportError:
+        DocumentFile = None
+
+    img = synthetic_frame(args.width, args.height)
+    temp_img_path = os.path.join(tempfile.gettempdir(), 'temp_ocr_img.png')
+
+    def png_round_trip():
+        img.save(temp_img_path)
+        if DocumentFile is not None:
+            DocumentFile.from_images([temp_img_path])
+        else:
+            np.asarray(Image.open(temp_img_path).convert('RGB'))
+        os.remove(temp_img_path)
+
+    def in_memory():
+        np.asarray(img)
+
+    decoder = "DocumentFile" if DocumentFile is not None else "PIL (doctr kurulu değil)"
+    print(f"DocTR girdi hazırlığı, {args.width}x{args.height}, {args.frames} kare, çözücü: {decoder}")
+    old_ms = time_per_call(png_round_trip, args.frames)
+    new_ms = time_per_call(in_memory, args.frames)
+    print_row("geçici PNG (eski)", old_ms)
+    print_row("bellekten NumPy (yeni)", new_ms, old_ms)
+
+
+# -----------------------------------------------------
+# OCR MOTORLARI
+# -----------------------------------------------------
+def bench_ocr_engines(args):
+    """Kurulu her OCR motorunun yükleme süresini ve kare başına gecikmesini ölçer"""
+    from ocr_engines import OCR_ENGINES
+
+    names = args.engines.split(',') if args.engines else list(OCR_ENGINES)
+    img = synthetic_frame(args.width, args.height)
+    print(f"OCR motorları, {args.width}x{args.height}, dil: {args.lang}, {args.frames} kare")
+    for name in names:
+        started = time.perf_counter()
+        try:
+            engine = OCR_ENGINES[name](args.lang)
+        except Exception as e:
+            print(f"  {name:<32} yüklenemedi: {e}")
+            continue
+        load_s = time.perf_counter() - started
+        try:
+            text = engine.read(img)  # İlk kare ısınma sayılır
+        except Exception as e:
+            print(f"  {name:<32} okunamadı: {e}")
+            continue
+        ms = time_per_call(lambda: engine.read(img), args.frames)
+        backend = getattr(engine, 'backend', '')
+        label = f"{name} ({backend})" if backend else name
+        print_row(label, ms)
+        print(f"  {'':<32} yükleme {load_s:.2f} sn, örnek: {text[:40]!r}")
+        close = getattr(engine, 'close', None)
+        if close is not None:
+            close()
+
+
+# -----------------------------------------------------
+# LIBRETRANSLATE SUNUCU SEÇİMİ
+# -----------------------------------------------------
+def bench_libre_servers(args):
+    """Yerel sahte sunucularla sunucu havuzunun yönlendirmesini ölçer.
+
+    Biri hızlı, biri yavaş, biri sürekli 503 dönen, biri kotası dolmuş
+    dört sunucu başlatılır; isteklerin nereye gittiği ve gecikme raporlanır.
+    """
+    from http_pool import HTTPSessionPool
+    from server_pool import ServerPool
+    from stub_servers import StubLibreTranslate
+
+    stubs = {
+        'yavaş': StubLibreTranslate(delay_s=0.05).start(),
+        'hatalı': StubLibreTranslate(status=503).start(),
+        'kota': StubLibreTranslate(status=429).start(),
+        'hızlı': StubLibreTranslate(delay_s=0.005).start(),
+    }
+    http = HTTPSessionPool()
+    pool = ServerPool([stub.url for stub in stubs.values()], base_backoff_s=0.5)
+    latencies = []
+
+    def probe(url):
+        return http.post(url, data={'q': 'test'}, timeout=2).status_code
+
+    try:
+        # Uygulamadaki arka plan yoklamasının ilk turu
+        pool.probe_once(probe)
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            for url in pool.candidates():
+                t0 = time.perf_counter()
+                try:
+                    response = http.post(url, data={'q': 'hello'}, timeout=2)
+                except Exception:
+                    pool.record_failure(url)
+                    continue
+                if response.status_code == 200:
+                    pool.record_success(url, (time.perf_counter() - t0) * 1000)
+                    break
+                pool.record_failure(url, quota=response.status_code == 429)
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        for stub in stubs.values():
+            stub.stop()
+        http.close()
+
+    latencies.sort()
+    print(f"LibreTranslate sunucu havuzu, {args.requests} istek")
+    for name, stub in stubs.items():
+        print(f"  {name:<10} {stub.requests:5d} istek")
+    print(f"  p50 {latencies[len(latencies) // 2]:.1f} ms, p99 {latencies[int(len(latencies) * 0.99) - 1]:.1f} ms")
+    print(f"  {pool.stats_text()}")
+
+
+# -----------------------------------------------------
+# ARGOS
+# -----------------------------------------------------
+def bench_argos(args):
+    """Her çağrıda dil çözümlemesi (eski) ile önbellekli çeviri nesnesini karşılaştırır"""
+    try:
+        import argostranslate.package
+    except ImportError:
+        print("argostranslate kurulu değil: pip install argostranslate")
+        return
+    from argos_backend import ArgosTranslationCache, resolve_translation
+
+    text = "The quick brown fox jumps over the lazy dog."
+
+    def per_call_lookup():
+        argostranslate.package.get_installed_packages()
+        resolve_translation(args.source, args.target).translate(text)
+
+    cache = ArgosTranslationCache()
+    started = time.perf_counter()
+    try:
+        cache.get(args.source, args.target)
+    except LookupError as e:
+        print(e)
+        return
+    load_ms = (time.perf_counter() - started) * 1000
+
+    def cached():
+        cache.get(args.source, args.target).translate(text)
+
+    print(f"Argos {args.source} -> {args.target}, {args.calls} çağrı (ilk yükleme {load_ms:.0f} ms)")
+    old_ms = time_per_call(per_call_lookup, args.calls)
+    new_ms = time_per_call(cached, args.calls)
+    print_row("her çağrıda çözümleme (eski)", old_ms)
+    print_row("önbellekli çeviri nesnesi (yeni)", new_ms, old_ms)
+
+
+# -----------------------------------------------------
+# TOPLU ÇEVİRİ
+# -----------------------------------------------------
+def bench_batch(args):
+    """Satır başına bir istek ile toplu istekleri karşılaştırır.
+
+    LibreTranslate yerel sahte sunucuya karşı (--delay ağ gecikmesi
+    benzetimi), Google gerçek servise karşı ölçülür.
+    """
+    from batch_translation import google_batch, libretranslate_batch, pack_batches
+
+    lines = [f"Line {i}: the quick brown fox jumps over the lazy dog." for i in range(args.lines)]
+    batches = pack_batches(lines, args.max_bytes)
+    text_bytes = sum(len(line.encode('utf-8')) for line in lines)
+
+    if args.backend == 'libretranslate':
+        from http_pool import HTTPSessionPool
+        from stub_servers import StubLibreTranslate
+
+        with StubLibreTranslate(delay_s=args.delay) as stub:
+            http = HTTPSessionPool()
+
+            def single():
+                for line in lines:
+                    http.post(stub.url, data={'q': line, 'source': 'en', 'target': 'tr', 'format': 'text'}).json()
+
+            def batched():
+                for batch in batches:
+                    libretranslate_batch(http, stub.url, [lines[i] for i in batch], 'en', 'tr')
+
+            results = []
+            for name, func in (("satır başına istek", single), ("toplu istek", batched)):
+                before_requests, before_bytes = stub.requests, stub.bytes_received
+                started = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - started
+                results.append((name, stub.requests - before_requests, stub.bytes_received - before_bytes, elapsed))
+            http.close()
+    else:
+        try:
+            from googletrans import Translator
+        except ImportError:
+            print("googletrans kurulu değil: pip install googletrans==4.0.0-rc1")
+            return
+        translator = Translator()
+        # Gerçek HTTP isteklerini say: httpx istemcisinin tüm istekleri send()'den geçer
+        sent = [0]
+        send = translator.client.send
+
+        def counting_send(*send_args, **send_kwargs):
+            sent[0] += 1
+            return send(*send_args, **send_kwargs)
+
+        translator.client.send = counting_send
+
+        def single():
+            for line in lines:
+                translator.translate(line, src='en', dest='tr')
+
+        def batched():
+            for batch in batches:
+                google_batch(translator, [lines[i] for i in batch], 'en', 'tr')
+
+        results = []
+        for name, func in (("satır başına istek", single), ("toplu istek", batched)):
+            before = sent[0]
+            started = time.perf_counter()
+            try:
+                func()
+            except Exception as e:
+                print(f"  {name}: {e}")
+                continue
+            results.append((name, sent[0] - before, None, time.perf_counter() - started))
+
+    print(f"{args.backend} toplu çeviri, {len(lines)} satır ({text_bytes} bayt metin), "
+          f"{len(batches)} grup, en fazla {args.max_bytes} bayt")
+    for name, request_count, sent_bytes, elapsed in results:
+        line = f"  {name:<20} {request_count:5d} istek, {len(lines) / elapsed:8.1f} satır/sn"
+        if sent_bytes is not None:
+            line += f", {sent_bytes / len(lines):6.1f} bayt/satır gövde"
+        print(line)
+
+
+# -----------------------------------------------------
+# EKRAN YAKALAMA
+# -----------------------------------------------------
+def bench_capture(args):
+    """Yalnızca yakalama: kare/sn ve kare başına ayrılan bellek.
+
+    Bellek tracemalloc ile ölçülür (Python ve NumPy ayırmaları); her kare
+    için ayırmanın zirvesi alınıp ortalanır. Gerçek bir ekran gerektirir.
+    """
+    from capture import CAPTURE_BACKENDS
+
+    names = args.backends.split(',') if args.backends else list(CAPTURE_BACKENDS)
+    region = {'x': args.x, 'y': args.y, 'width': args.width, 'height': args.height}
+    print(f"Ekran yakalama, {args.width}x{args.height}, {args.frames} kare")
+    for name in names:
+        try:
+            capture = CAPTURE_BACKENDS[name]()
+            capture.grab(region)  # Isınma: bağlantı ve tampon oluşturulur
+        except Exception as e:
+            print(f"  {name:<32} kullanılamıyor: {e}")
+            continue
+
+        tracemalloc.start()
+        allocated = 0
+        started = time.perf_counter()
+        for _ in range(args.frames):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            capture.grab(region)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        elapsed = time.perf_counter() - started
+        tracemalloc.stop()
+        capture.close()
+        print(f"  {name:<32} {args.frames / elapsed:8.1f} kare/sn, "
+              f"{allocated / args.frames / 1024:8.1f} KiB/kare ayrılan")
+
+
+# -----------------------------------------------------
+# ÖN İŞLEME
+# -----------------------------------------------------
+def bench_preprocess(args):
+    """Ön işleme adımlarının kare başına süresi; --engine verilirse OCR'a etkisi"""
+    import numpy as np
+    from preprocessing import STEP_NAMES, Preprocessor
+
+    img = synthetic_frame(args.width, args.height)
+    frame = np.asarray(img).copy()
+    preprocessor = Preprocessor(threshold=args.threshold, upscale=args.upscale)
+    preprocessor.process(frame)  # Isınma: ara tamponlar ayrılır
+    preprocessor.timings_ms.clear()
+    total_ms = time_per_call(lambda: preprocessor.process(frame), args.frames)
+    out = preprocessor.process(frame)
+    print(f"Ön işleme, {args.width}x{args.height} -> {out.shape[1]}x{out.shape[0]}, {args.frames} kare")
+    for step, ms in preprocessor.timings_ms.items():
+        print_row(STEP_NAMES[step], ms)
+    print_row("toplam", total_ms)
+
+    if not args.engine:
+        return
+    from ocr_engines import OCR_ENGINES
+    from PIL import Image
+
+    try:
+        engine = OCR_ENGINES[args.engine](args.lang)
+        engine.read(img)
+    except Exception as e:
+        print(f"  {args.engine} kullanılamıyor: {e}")
+        return
+    processed = Image.fromarray(out)
+    raw_ms = time_per_call(lambda: engine.read(img), args.ocr_frames)
+    processed_ms = time_per_call(lambda: engine.read(processed), args.ocr_frames)
+    print(f"{args.engine} OCR")
+    print_row("ham kare", raw_ms)
+    print_row("ön işlenmiş kare", processed_ms + total_ms, raw_ms)
+    print(f"  {'':<32} ham: {engine.read(img)[:40]!r}")
+    print(f"  {'':<32} ön işlenmiş: {engine.read(processed)[:40]!r}")
+
+
+# -----------------------------------------------------
+# UÇTAN UCA BORU HATTI
+# -----------------------------------------------------
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Press any key to continue.",
+    "Your journey begins in the northern village.",
+    "Do you want to save your progress?",
+    "The merchant has new items for sale.",
+    "A strange noise is coming from the cellar.",
+]
+
+
+def render_frames(count, width, height):
+    """Sentetik (kare, gerçek metin) çiftleri; her kare farklı bir cümle taşır"""
+    frames = []
+    for i in range(count):
+        text = SENTENCES[i % len(SENTENCES)]
+        lines = 2
+        truth = "\n".join(f"{n + 1}. {text}" for n in range(lines))
+        frames.append((synthetic_frame(width, height, text=text, lines=lines), truth))
+    return frames
+
+
+def load_frames(directory, limit=None):
+    """Kayıtlı kareleri sırayla yükler; yanında aynı adlı .txt varsa gerçek metin sayılır"""
+    from PIL import Image
+
+    names = sorted(
+        name for name in os.listdir(directory)
+        if os.path.splitext(name)[1].lower() in ('.png', '.jpg', '.jpeg', '.bmp')
+    )
+    frames = []
+    for name in names[:limit]:
+        img = Image.open(os.path.join(directory, name)).convert('RGB')
+        truth_path = os.path.join(directory, os.path.splitext(name)[0] + '.txt')
+        truth = None
+        if os.path.exists(truth_path):
+            with open(truth_path, 'r', encoding='utf-8') as f:
+                truth = f.read().strip()
+        frames.append((img, truth))
+    return frames
+
+
+class _TruthEngine:
+    """OCR yerine karenin gerçek metnini döner; çeviri arka uçlarını OCR'dan bağımsız ölçmek için"""
+    backend = ''
+
+    def read(self, img):
+        return img.info.get('truth') or ""
+
+
+def _translation_backends(names, http, stub_url, args):
+    """Arka uç adı -> (metin -> çeviri) fonksiyonu; kurulamayanlar için hata metni"""
+    from batch_translation import libretranslate_batch, pack_batches
+
+    backends = {}
+    for name in names:
+        if name == 'libretranslate':
+            def translate(text):
+                response = http.post(stub_url, data={
+                    'q': text, 'source': args.source, 'target': args.target, 'format': 'text'
+                }, timeout=8)
+                return response.json()['translatedText']
+            backends[name] = translate
+        elif name == 'libretranslate-batch':
+            def translate(text):
+                lines = text.split("\n")
+                results = []
+                for batch in pack_batches(lines):
+                    results.extend(libretranslate_batch(
+                        http, stub_url, [lines[i] for i in batch], args.source, args.target
+                    ))
+                return "\n".join(results)
+            backends[name] = translate
+        elif name == 'argos':
+            try:
+                from argos_backend import ArgosBatchTranslator, ArgosTranslationCache, resolve_workers
+                translations = ArgosTranslationCache()
+                translations.get(args.source, args.target)
+            except Exception as e:
+                backends[name] = f"kullanılamıyor: {e}"
+                continue
+            batch = ArgosBatchTranslator(translations, resolve_workers(0))
+            backends[name] = lambda text, batch=batch: batch.translate(text, args.source, args.target)
+        elif name == 'google':
+            # Google için yerel sahte sunucu yok; yalnızca açıkça istenirse gerçek servise gider
+            try:
+                from googletrans import Translator
+            except ImportError as e:
+                backends[name] = f"kullanılamıyor: {e}"
+                continue
+            translator = Translator()
+            backends[name] = lambda text: translator.translate(text, src=args.source, dest=args.target).text
+        else:
+            backends[name] = "bilinmeyen arka uç"
+    return backends
+
+
+def bench_pipeline(args):
+    """Kayıtlı ya da sentetik kareleri ön işleme -> OCR -> çeviri hattından geçirir.
+
+    Ekran ve Tk gerektirmez. Ağ arka uçları yerel sahte sunucuya gider.
+    Her OCR motoru için kareler bir kez okunur, ardından her çeviri arka
+    ucu aynı metinlerle ölçülür. Sonuç JSON olarak yazılır.
+    """
+    import numpy as np
+    from PIL import Image
+    from http_pool import HTTPSessionPool
+    from ocr_cache import OCRResultCache
+    from ocr_engines import OCR_ENGINES
+    from preprocessing import Preprocessor
+    from stub_servers import StubLibreTranslate
+
+    if args.frames_dir:
+        frames = load_frames(args.frames_dir, args.frames)
+        source = args.frames_dir
+    else:
+        frames = render_frames(args.frames, args.width, args.height)
+        source = 'synthetic'
+    engine_names = args.engines.split(',') if args.engines else list(OCR_ENGINES) + ['truth']
+    backend_names = args.backends.split(',')
+    preprocessor = None if args.no_preprocess else Preprocessor(upscale=args.upscale)
+
+    report = {
+        'source': source,
+        'frames': len(frames),
+        'preprocess': preprocessor is not None,
+        'source_lang': args.source,
+        'target_lang': args.target,
+        'stub_delay_s': args.delay,
+        'runs': [],
+        'skipped': [],
+    }
+
+    # Ön işleme motordan bağımsızdır; bir kez yapılır
+    inputs = []
+    preprocess_ms = []
+    for img, truth in frames:
+        started = time.perf_counter()
+        if preprocessor is not None:
+            processed = preprocessor.process(np.asarray(img))
+            ocr_input = Image.fromarray(processed) if processed is not None else None
+        else:
+            ocr_input = img
+        preprocess_ms.append((time.perf_counter() - started) * 1000)
+        if ocr_input is not None:
+            ocr_input.info['truth'] = truth
+        inputs.append(ocr_input)
+    report['preprocess_ms'] = latency_summary(preprocess_ms)
+
+    stub = StubLibreTranslate(delay_s=args.delay).start()
+    http = HTTPSessionPool()
+    try:
+        backends = _translation_backends(backend_names, http, stub.url, args)
+        for backend_name, func in backends.items():
+            if isinstance(func, str):
+                report['skipped'].append({'backend': backend_name, 'reason': func})
+
+        for engine_name in engine_names:
+            started = time.perf_counter()
+            try:
+                engine = _TruthEngine() if engine_name == 'truth' else OCR_ENGINES[engine_name](args.lang)
+            except Exception as e:
+                report['skipped'].append({'engine': engine_name, 'reason': f"yüklenemedi: {e}"})
+                continue
+            load_s = time.perf_counter() - started
+
+            texts = []
+            ocr_ms = []
+            ocr_cache = OCRResultCache() if args.ocr_cache else None
+            try:
+                for ocr_input in inputs:
+                    started = time.perf_counter()
+                    if ocr_input is None:
+                        text = ""
+                    elif ocr_cache is not None:
+                        key = ocr_cache.key(ocr_input, engine_name, args.lang)
+                        text = ocr_cache.get(key)
+                        if text is None:
+                            text = engine.read(ocr_input)
+                            ocr_cache.put(key, text)
+                    else:
+                        text = engine.read(ocr_input)
+                    texts.append(text)
+                    ocr_ms.append((time.perf_counter() - started) * 1000)
+            except Exception as e:
+                report['skipped'].append({'engine': engine_name, 'reason': f"okunamadı: {e}"})
+                continue
+            finally:
+                close = getattr(engine, 'close', None)
+                if close is not None:
+                    close()
+
+            for backend_name, func in backends.items():
+                if isinstance(func, str):
+                    continue
+                translate_ms = []
+                errors = 0
+                for text in texts:
+                    started = time.perf_counter()
+                    try:
+                        if text:
+                            func(text)
+                    except Exception:
+                        errors += 1
+                    translate_ms.append((time.perf_counter() - started) * 1000)
+                total_s = (sum(preprocess_ms) + sum(ocr_ms) + sum(translate_ms)) / 1000
+                report['runs'].append({
+                    'engine': engine_name,
+                    'engine_backend': getattr(engine, 'backend', ''),
+                    'translator': backend_name,
+                    'stub': backend_name.startswith('libretranslate'),
+                    'engine_load_s': round(load_s, 3),
+                    'stages_ms': {
+                        'preprocess': report['preprocess_ms'],
+                        'ocr': latency_summary(ocr_ms),
+                        'translate': latency_summary(translate_ms),
+                    },
+                    'translate_errors': errors,
+                    'empty_ocr': sum(1 for text in texts if not text),
+                    'ocr_cache_hit_rate': round(ocr_cache.hit_rate, 3) if ocr_cache is not None else None,
+                    'throughput_fps': round(len(frames) / total_s, 2) if total_s else None,
+                    'peak_rss_mb': peak_rss_mb(),
+                })
+    finally:
+        stub.stop()
+        http.close()
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+# -----------------------------------------------------
+# BAŞLANGIÇ SÜRESİ
+# -----------------------------------------------------
+# Ana betiğin her yapılandırmada başlangıçta import ettiği Tk dışı modüller
+STARTUP_BASE_MODULES = [
+    'requests', 'PIL.Image', 'pytesseract', 'numpy', 'startup', 'frame_tools', 'capture',
+    'preprocessing', 'translation_cache', 'http_pool', 'server_pool', 'hedging',
+    'batch_translation', 'argos_backend', 'pipeline', 'ui_updates', 'ocr_engines',
+]
+
+_STARTUP_PROBE = """
+import importlib, json, sys, time
+started = time.perf_counter()
+for name in json.loads(sys.argv[1]):
+    importlib.import_module(name)
+base_ms = (time.perf_counter() - started) * 1000
+for name in json.loads(sys.argv[2]):
+    importlib.import_module(name)
+total_ms = (time.perf_counter() - started) * 1000
+import benchmark
+print(json.dumps({'base_ms': base_ms, 'total_ms': total_ms, 'rss_mb': benchmark.peak_rss_mb()}))
+"""
+
+
+def _startup_probe(base, extra, repeat):
+    """Modülleri temiz bir süreçte import eder; medyan süreleri döner"""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _STARTUP_PROBE, json.dumps(base), json.dumps(extra)],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    runs.sort(key=lambda run: run['total_ms'])
+    return runs[len(runs) // 2]
+
+
+def bench_startup(args):
+    """Her (OCR motoru, çeviri servisi) yapılandırması için import süresi ve bellek.
+
+    Yeni yolda yalnızca seçilen motorun ve servisin modülleri yüklenir;
+    karşılaştırma için eskisi gibi tüm kurulu kütüphanelerin yüklendiği
+    durum da ölçülür. Tk ve klavye kancası ölçüme dahil değildir.
+    """
+    from startup import OCR_ENGINE_MODULES, TRANSLATOR_MODULES, module_available
+
+    base = [name for name in STARTUP_BASE_MODULES if module_available(name.split('.')[0])]
+    missing = set()
+
+    def installed(modules):
+        present = [name for name in modules if module_available(name)]
+        missing.update(set(modules) - set(present))
+        return present
+
+    print(f"Başlangıç importları, {args.repeat} tekrar medyanı")
+    eager = installed(sorted({name for modules in OCR_ENGINE_MODULES.values() for name in modules} |
+                             {name for modules in TRANSLATOR_MODULES.values() for name in modules} |
+                             {'httpx'}))
+    baseline = _startup_probe(base, eager, args.repeat)
+    print(f"  {'hepsi (eski)':<32} {baseline['total_ms']:8.0f} ms, {baseline['rss_mb']} MB")
+    for engine, engine_modules in OCR_ENGINE_MODULES.items():
+        for service, service_modules in TRANSLATOR_MODULES.items():
+            extra = installed(list(engine_modules) + list(service_modules) +
+                              (['httpx'] if service in ('google', 'libretranslate') else []))
+            result = _startup_probe(base, extra, args.repeat)
+            label = f"{engine}/{service}"
+            print(f"  {label:<32} {result['total_ms']:8.0f} ms, {result['rss_mb']} MB "
+                  f"(ortak {result['base_ms']:.0f} ms, {baseline['total_ms'] / result['total_ms']:.1f}x)")
+    if missing:
+        print(f"  kurulu değil, ölçüme katılmadı: {', '.join(sorted(missing))}")
+
+
+# -----------------------------------------------------
+# KAYDIRMA TAKİBİ
+# -----------------------------------------------------
+def scrolling_frames(count, width, height, step, line_height=20):
+    """Uzun bir sohbet günlüğünü `step` piksel kaydırarak kareler üretir.
+
+    Adımlar değişkendir (0, step, 2*step, yarım adım) ki tahmin her kaymada
+    sınansın. (kare, gerçek kayma) listesi döner.
+    """
+    from PIL import Image, ImageDraw
+
+    steps = [step, step, 2 * step, step // 2, 0]
+    total = sum(steps[i % len(steps)] for i in range(count)) + height
+    page = Image.new('RGB', (width, total + line_height), (20, 20, 30))
+    draw = ImageDraw.Draw(page)
+    for i in range(total // line_height + 1):
+        draw.text((10, 4 + i * line_height), f"[{i:04d}] player{i % 7}: {SENTENCES[i % len(SENTENCES)]}",
+                  fill=(240, 240, 240))
+    frames = []
+    y = 0
+    for i in range(count):
+        shift = steps[i % len(steps)] if i else 0
+        y += shift
+        frames.append((page.crop((0, y, width, y + height)), shift))
+    return frames
+
+
+def bench_scroll(args):
+    """Satır korelasyonuyla kayma tahmini: süre, doğruluk ve OCR'lanan alan.
+
+    --engine verilirse tüm kareyi okumak ile yalnızca yeni şeridi okumak
+    arasındaki OCR süresi de karşılaştırılır.
+    """
+    import numpy as np
+    from frame_tools import ScrollTracker, estimate_scroll, find_text_lines, line_fingerprint, row_signature
+
+    frames = scrolling_frames(args.frames, args.width, args.height, args.step)
+    grays = [np.asarray(img.convert('L')) for img, _ in frames]
+    max_shift = args.height // 2
+
+    signatures = [row_signature(gray) for gray in grays]
+    correct = sum(
+        estimate_scroll(signatures[i - 1], signatures[i], max_shift) == frames[i][1]
+        for i in range(1, len(frames))
+    )
+    index = iter(range(1, len(frames)))
+
+    def estimate():
+        i = next(index, None)
+        if i is None:
+            return
+        estimate_scroll(row_signature(grays[i - 1]), row_signature(grays[i]), max_shift)
+
+    estimate_ms = time_per_call(estimate, len(frames) - 1)
+    print(f"Kaydırma takibi, {args.width}x{args.height}, {args.frames} kare, adım {args.step} px")
+    print_row("kayma tahmini (imza dahil)", estimate_ms)
+    print(f"  {'doğru tahmin':<32} {correct}/{len(frames) - 1}")
+
+    if args.engine:
+        from ocr_engines import OCR_ENGINES
+        try:
+            engine = OCR_ENGINES[args.engine](args.lang)
+            engine.read(frames[0][0])
+        except Exception as e:
+            print(f"  {args.engine} kullanılamıyor: {e}")
+            return
+        ocr = engine.read
+    else:
+        # Motor yoksa her satır için piksellerinden türetilen kararlı bir kimlik "okunur";
+        # okunan alan ve birleştirmenin doğruluğu yine ölçülebilir
+        def ocr(img):
+            return "\n".join(line_fingerprint(img.crop(box)).hex()[:8] for box in find_text_lines(img))
+
+    started = time.perf_counter()
+    full = [ocr(img) for img, _ in frames]
+    full_ms = (time.perf_counter() - started) * 1000 / len(frames)
+    tracker = ScrollTracker(ocr)
+    started = time.perf_counter()
+    tracked = [tracker.read(img) for img, _ in frames]
+    tracked_ms = (time.perf_counter() - started) * 1000 / len(frames)
+    label = args.engine or "satır kimliği"
+    print_row(f"{label}: tüm kare", full_ms)
+    print_row(f"{label}: yalnızca yeni şerit", tracked_ms, full_ms)
+    # Üst kenarda yarım kalan satırı izleyici bilerek atar; karşılaştırma tam satırlarla yapılır
+    matches = 0
+    for (img, _), expected, result in zip(frames, full, tracked):
+        boxes = find_text_lines(img)
+        if len(boxes) > 1 and boxes[0][1] == 0 and boxes[0][3] - boxes[0][1] < boxes[1][3] - boxes[1][1]:
+            expected = "\n".join(expected.split("\n")[1:])
+        matches += expected == result
+    print(f"  {'tüm kare okumasıyla aynı satırlar':<32} {matches}/{len(frames)}")
+    print(f"  {'':<32} {tracker.stats_text()}")
+
+
+# -----------------------------------------------------
+# GERİLEME DENETİMLERİ
+# -----------------------------------------------------
+def check_frame_change():
+    """Büyük bölgede tek karakterlik değişiklik (10 -> 11 ok) değişim sayılmalı"""
+    import numpy as np
+    from frame_tools import FrameChangeDetector
+
+    def frame(width, height, text):
+        img = Image.new('RGB', (width, height), (20, 20, 30))
+        ImageDraw.Draw(img).text((width // 3, height // 2), text, fill=(240, 240, 240))
+        return np.asarray(img).copy()
+
+    for width, height in ((400, 200), (1200, 600), (1920, 1080)):
+        detector = FrameChangeDetector()
+        assert detector.has_changed(frame(width, height, "You have 10 arrows"))
+        assert not detector.has_changed(frame(width, height, "You have 10 arrows")), \
+            f"{width}x{height}: aynı kare değişmiş sayıldı"
+        for text in ("You have 11 arrows", "You have 18 arrows"):
+            assert detector.has_changed(frame(width, height, text)), \
+                f"{width}x{height}: '{text}' değişikliği kaçırıldı"
+
+
+def check_probe_backoff():
+    """Hiç yanıt vermemiş sunucu devre kesicisi açıkken yoklanmamalı"""
+    from server_pool import ServerPool
+
+    now = [0.0]
+    pool = ServerPool(['http://dead', 'http://alive'], clock=lambda: now[0])
+    probed = []
+
+    def probe(url):
+        probed.append((now[0], url))
+        return 200 if url == 'http://alive' else 0
+
+    for step in range(60):
+        now[0] = step * 10.0
+        pool.probe_once(probe)
+    dead = [t for t, url in probed if url == 'http://dead']
+    # 5, 10, 20, 40, 80, 160, 300 sn geri çekilmeyle 600 sn içinde en fazla ~10 yoklama
+    assert len(dead) <= 10, f"ölü sunucu {len(dead)} kez yoklandı: {dead}"
+    assert all(later - earlier >= 10.0 for earlier, later in zip(dead, dead[1:]))
+    assert sum(url == 'http://alive' for _, url in probed) == 1, "sağlıklı sunucu yeniden yoklandı"
+
+
+def check_incremental_translation():
+    """Bir satır kayan sohbette çevirici yalnızca eklenen satırları almalı"""
+    from text_tracking import IncrementalTranslator
+
+    received = []
+
+    def translate_lines(lines):
+        received.append(list(lines))
+        return [line.upper() for line in lines]
+
+    translator = IncrementalTranslator(translate_lines)
+    log = [f"player{i % 3}: {SENTENCES[i % len(SENTENCES)]}" for i in range(20)]
+    for start in range(0, 12):
+        window = log[start:start + 8]
+        assert translator.translate("\n".join(window)) == "\n".join(window).upper()
+    assert received[0] == log[:8]
+    for start, lines in enumerate(received[1:], 1):
+        assert lines == [log[start + 7]], f"{start}. kayma: {len(lines)} satır çevrildi: {lines}"
+    # Sayısı değişen satır (10 -> 11 ok) eski çevirisiyle gösterilmemeli
+    translator.reset()
+    translator.translate("Inventory\nYou have 10 arrows")
+    assert translator.translate("Inventory\nYou have 11 arrows") == "INVENTORY\nYOU HAVE 11 ARROWS"
+
+
+CHECKS = {
+    'frame-change': check_frame_change,
+    'probe-backoff': check_probe_backoff,
+    'incremental-translation': check_incremental_translation,
+}
+
+
+def run_checks(args):
+    """Bilinen hataların geri gelmediğini doğrular; başarısızlıkta çıkış kodu 1"""
+    names = [name for name in args.only.split(',') if name] or list(CHECKS)
+    failed = 0
+    for name in names:
+        try:
+            CHECKS[name]()
+            print(f"  {name:<32} tamam")
+        except AssertionError as e:
+            failed += 1
+            print(f"  {name:<32} BAŞARISIZ: {e}")
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translate Now performans ölçümleri")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('doctr-input', help="DocTR'a görüntü aktarım maliyeti")
+    p.add_argument('--frames', type=int, default=200)
+    p.add_argument('--width', type=int, default=800)
+    p.add_argument('--height', type=int, default=300)
+    p.set_defaults(func=bench_doctr_input)
+
+    p = sub.add_parser('ocr-engines', help="OCR motorlarının kare başına gecikmesi")
+    p.add_argument('--engines', default='', help="virgülle ayrılmış motor adları (varsayılan: hepsi)")
+    p.add_argument('--lang', default='en')
+    p.add_argument('--frames', type=int, default=20)
+    p.add_argument('--width', type=int, default=800)
+    p.add_argument('--height', type=int, default=300)
+    p.set_defaults(func=bench_ocr_engines)
+
+    p = sub.add_parser('libre-servers', help="Sahte sunucularla sunucu seçimi")
+    p.add_argument('--requests', type=int, default=100)
+    p.set_defaults(func=bench_libre_servers)
+
+    p = sub.add_parser('argos', help="Argos çeviri nesnesi önbelleği")
+    p.add_argument('--source', default='en')
+    p.add_argument('--target', default='tr')
+    p.add_argument('--calls', type=int, default=50)
+    p.set_defaults(func=bench_argos)
+
+    p = sub.add_parser('batch', help="Satır başına istek ile toplu isteği karşılaştırır")
+    p.add_argument('--backend', choices=['libretranslate', 'google'], default='libretranslate')
+    p.add_argument('--lines', type=int, default=200)
+    p.add_argument('--max-bytes', type=int, default=4000)
+    p.add_argument('--delay', type=float, default=0.02, help="sahte sunucu gecikmesi (sn)")
+    p.set_defaults(func=bench_batch)
+
+    p = sub.add_parser('capture', help="Yakalama arka uçlarının kare/sn ve bellek ayırma değerleri")
+    p.add_argument('--backends', default='', help="virgülle ayrılmış arka uç adları (varsayılan: hepsi)")
+    p.add_argument('--frames', type=int, default=300)
+    p.add_argument('--x', type=int, default=0)
+    p.add_argument('--y', type=int, default=0)
+    p.add_argument('--width', type=int, default=800)
+    p.add_argument('--height', type=int, default=300)
+    p.set_defaults(func=bench_capture)
+
+    p = sub.add_parser('preprocess', help="Ön işleme adımlarının süre dökümü")
+    p.add_argument('--frames', type=int, default=200)
+    p.add_argument('--width', type=int, default=800)
+    p.add_argument('--height', type=int, default=300)
+    p.add_argument('--upscale', type=int, default=2)
+    p.add_argument('--threshold', action='store_true', help="uyarlamalı eşiği aç")
+    p.add_argument('--engine', default='', help="karşılaştırılacak OCR motoru (ör. tesseract)")
+    p.add_argument('--lang', default='en')
+    p.add_argument('--ocr-frames', type=int, default=10)
+    p.set_defaults(func=bench_preprocess)
+
+    p = sub.add_parser('pipeline', help="Uçtan uca başsız ölçüm, JSON çıktı")
+    p.add_argument('--frames-dir', default='', help="kayıtlı karelerin klasörü (varsayılan: sentetik)")
+    p.add_argument('--frames', type=int, default=50, help="en fazla kare sayısı")
+    p.add_argument('--width', type=int, default=800)
+    p.add_argument('--height', type=int, default=300)
+    p.add_argument('--engines', default='', help="virgülle ayrılmış OCR motorları; 'truth' OCR'ı atlar")
+    p.add_argument('--backends', default='libretranslate,libretranslate-batch,argos',
+                   help="virgülle ayrılmış çeviri arka uçları ('google' gerçek servise gider)")
+    p.add_argument('--lang', default='en')
+    p.add_argument('--source', default='en')
+    p.add_argument('--target', default='tr')
+    p.add_argument('--delay', type=float, default=0.02, help="sahte sunucu gecikmesi (sn)")
+    p.add_argument('--upscale', type=int, default=1)
+    p.add_argument('--no-preprocess', action='store_true')
+    p.add_argument('--ocr-cache', action='store_true', help="parmak izi -> OCR metni önbelleğini kullan")
+    p.add_argument('--output', default='', help="JSON dosyası (varsayılan: standart çıktı)")
+    p.set_defaults(func=bench_pipeline)
+
+    p = sub.add_parser('startup', help="Yapılandırma başına başlangıç import süresi")
+    p.add_argument('--repeat', type=int, default=3)
+    p.set_defaults(func=bench_startup)
+
+    p = sub.add_parser('scroll', help="Sentetik kayan karelerde kayma tahmini ve şerit OCR'ı")
+    p.add_argument('--frames', type=int, default=100)
+    p.add_argument('--width', type=int, default=800)
+    p.add_argument('--height', type=int, default=300)
+    p.add_argument('--step', type=int, default=20, help="kare başına temel kayma (piksel)")
+    p.add_argument('--engine', default='', help="karşılaştırılacak OCR motoru (ör. tesseract)")
+    p.add_argument('--lang', default='en')
+    p.set_defaults(func=bench_scroll)
+
+    p = sub.add_parser('check', help="Gerileme denetimleri (başarısızlıkta çıkış kodu 1)")
+    p.add_argument('--only', default='', help="virgülle ayrılmış denetim adları (varsayılan: hepsi)")
+    p.set_defaults(func=run_checks)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
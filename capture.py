@@ -0,0 +1,99 @@
+"""
+Ekran bölgesi yakalama arka uçları.
+
+Her arka uç `grab(region)` ile bölgeyi yeniden kullanılan tek bir RGB
+tampona yazar ve bu tamponun (yükseklik, genişlik, 3) NumPy görünümünü
+döner. Görünüm bir sonraki `grab` çağrısında üzerine yazılır; başka bir iş
+parçacığına aktarılacak kareler önce kopyalanmalıdır (`frame.copy()`).
+
+Linux/X11, Windows ve macOS'ta MSS (Linux'ta XGetImage/XShm) kullanılır;
+MSS kurulu değilse pyautogui yedek olarak devreye girer.
+"""
+import numpy as np
+
+
+class _BufferedCapture:
+    """Bölge boyutu değişmedikçe aynı tamponu kullanan temel sınıf"""
+    name = ''
+
+    def __init__(self):
+        self._buffer = None
+
+    def _frame(self, height, width):
+        if self._buffer is None or self._buffer.shape[:2] != (height, width):
+            self._buffer = np.empty((height, width, 3), dtype=np.uint8)
+        return self._buffer
+
+    def close(self):
+        self._buffer = None
+
+
+class MSSCapture(_BufferedCapture):
+    """MSS ile yakalama.
+
+    MSS nesnesi (X bağlantısı) iş parçacığına bağlıdır; bu yüzden ilk
+    `grab` çağrısında, yakalama iş parçacığında oluşturulur. BGRA ham veri
+    kopyalanmadan NumPy ile görülür ve tek adımda RGB tampona aktarılır.
+    """
+    name = 'mss'
+
+    def __init__(self):
+        super().__init__()
+        import mss
+        self._mss_module = mss
+        self._sct = None
+
+    def grab(self, region):
+        if self._sct is None:
+            self._sct = self._mss_module.mss()
+        shot = self._sct.grab({
+            'left': region['x'], 'top': region['y'],
+            'width': region['width'], 'height': region['height']
+        })
+        height, width = shot.height, shot.width
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(height, width, 4)
+        frame = self._frame(height, width)
+        np.copyto(frame, bgra[:, :, 2::-1])
+        return frame
+
+    def close(self):
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+        super().close()
+
+
+class PyAutoGUICapture(_BufferedCapture):
+    """pyautogui.screenshot ile yakalama (her karede yeni PIL görüntüsü)"""
+    name = 'pyautogui'
+
+    def __init__(self):
+        super().__init__()
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def grab(self, region):
+        img = self._pyautogui.screenshot(region=(
+            region['x'], region['y'], region['width'], region['height']
+        ))
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        frame = self._frame(img.height, img.width)
+        frame[...] = np.asarray(img)
+        return frame
+
+
+CAPTURE_BACKENDS = {
+    'mss': MSSCapture,
+    'pyautogui': PyAutoGUICapture,
+}
+
+
+def create_capture(backend='auto'):
+    """İstenen arka ucu oluşturur; 'auto' kurulu olan en hızlısını seçer"""
+    if backend != 'auto':
+        return CAPTURE_BACKENDS[backend]()
+    try:
+        return MSSCapture()
+    except ImportError:
+        return PyAutoGUICapture()
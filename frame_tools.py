@@ -0,0 +1,353 @@
+"""
+Ekran görüntüsü kareleri üzerinde çalışan yardımcılar.
+
+Bu modül Tkinter'a ve ekrana bağımlı değildir; Pillow ve NumPy kullanır.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image, ImageChops
+
+
+# -----------------------------------------------------
+# KARE DEĞİŞİM DEDEKTÖRÜ
+# -----------------------------------------------------
+class FrameChangeDetector:
+    """Yakalanan bölgenin bir önceki kareden farklı olup olmadığını söyler.
+
+    Kare gri tonlamaya çevrilip block x block piksellik bloklara küçültülür
+    (her piksel bir bloğun ortalamasıdır). Blok boyu piksel cinsinden sabit
+    olduğundan ızgara bölgeyle birlikte büyür; büyük bir bölgede de tek bir
+    karakterin değişmesi kendi bloğunun ortalamasını belirgin biçimde
+    değiştirir. İki kare arasındaki en büyük blok farkı `tolerance` değerini
+    aşarsa kare değişmiş sayılır. Böylece imleç yanıp sönmesi ya da
+    sıkıştırma gürültüsü OCR'ı tetiklemez.
+    """
+
+    def __init__(self, block=8, tolerance=8):
+        self.block = max(1, int(block))
+        self.tolerance = max(0, int(tolerance))
+        self.frames_total = 0
+        self.frames_skipped = 0
+        self._last_digest = None
+        self._last_thumb = None
+        self._last_size = None
+        self._lock = threading.Lock()
+
+    def _thumbnail(self, img):
+        if isinstance(img, np.ndarray):
+            return self._array_thumbnail(img)
+        gray = img.convert('L')
+        width, height = gray.size
+        return gray.resize((-(-width // self.block), -(-height // self.block)), Image.BOX)
+
+    def _array_thumbnail(self, frame):
+        """(y, g, 3) RGB dizisini blok ortalamalarına indirger.
+
+        Önce ardışık satır blokları bitişik bellekte toplanır (tam kare
+        boyutunda ara dizi ayrılmaz), sonra küçük toplam dizisinde sütun
+        blokları. Kenardaki eksik bloklar da sayılır.
+        """
+        block = self.block
+        frame = frame[:, :, :3]
+        height, width = frame.shape[:2]
+        full = height // block
+        row_sums = frame[:full * block].reshape(full, block, width * 3).sum(axis=1, dtype=np.uint32)
+        row_sums = row_sums.reshape(full, width, 3)
+        if height % block:
+            rest = frame[full * block:].sum(axis=0, dtype=np.uint32)
+            row_sums = np.concatenate([row_sums, rest[None]])
+        rows = np.arange(0, height, block)
+        cols = np.arange(0, width, block)
+        sums = np.add.reduceat(row_sums, cols, axis=1)
+        counts = np.outer(np.diff(np.append(rows, height)), np.diff(np.append(cols, width)))
+        gray = sums @ np.array([299, 587, 114], dtype=np.uint32) // (counts * 1000).astype(np.uint32)
+        return Image.fromarray(gray.astype(np.uint8), 'L')
+
+    @staticmethod
+    def _size(img):
+        if isinstance(img, np.ndarray):
+            return img.shape[1], img.shape[0]
+        return img.size
+
+    def has_changed(self, img):
+        """Kare değiştiyse True döner ve referans kareyi günceller.
+
+        `img` bir PIL görüntüsü ya da (y, g, 3) RGB NumPy dizisi olabilir.
+        """
+        thumb = self._thumbnail(img)
+        size = self._size(img)
+        digest = hashlib.blake2b(thumb.tobytes(), digest_size=16).digest()
+        with self._lock:
+            self.frames_total += 1
+            if self._last_thumb is not None and self._last_size == size:
+                if digest == self._last_digest:
+                    self.frames_skipped += 1
+                    return False
+                diff = ImageChops.difference(thumb, self._last_thumb)
+                if diff.getextrema()[1] <= self.tolerance:
+                    # Referansı güncellemiyoruz: yavaş kayma birikip
+                    # sonunda eşiği aşınca yakalanır.
+                    self.frames_skipped += 1
+                    return False
+            self._last_digest = digest
+            self._last_thumb = thumb
+            self._last_size = size
+            return True
+
+    def reset(self):
+        """Referans kareyi unutur; sonraki kare her zaman değişmiş sayılır."""
+        with self._lock:
+            self._last_digest = None
+            self._last_thumb = None
+            self._last_size = None
+
+    @property
+    def skip_rate(self):
+        if not self.frames_total:
+            return 0.0
+        return self.frames_skipped / self.frames_total
+
+    def stats_text(self):
+        return f"Atlanan kare: {self.frames_skipped}/{self.frames_total} (%{self.skip_rate * 100:.0f})"
+
+
+# -----------------------------------------------------
+# METİN SATIRI TAKİBİ
+# -----------------------------------------------------
+def find_text_lines(img, contrast=40, min_height=6, max_gap=2, padding=2):
+    """Görüntüdeki yatay metin satırlarını (sol, üst, sağ, alt) kutuları olarak döner.
+
+    Arka plan rengi en sık görülen gri ton kabul edilir; ondan `contrast`
+    kadar farklı pikseller mürekkep sayılır. Mürekkep içeren ardışık satırlar
+    (en fazla `max_gap` piksel boşlukla) tek bir metin satırı olur.
+    """
+    gray = np.asarray(img.convert('L'))
+    height, width = gray.shape
+    background = np.bincount(gray.ravel(), minlength=256).argmax()
+    ink = np.abs(gray.astype(np.int16) - int(background)) > contrast
+    rows = np.flatnonzero(ink.any(axis=1))
+    if rows.size == 0:
+        return []
+
+    # Boşluğu max_gap'ten büyük olan yerlerden satır gruplarına böl
+    breaks = np.flatnonzero(np.diff(rows) > max_gap + 1)
+    starts = np.concatenate(([rows[0]], rows[breaks + 1]))
+    ends = np.concatenate((rows[breaks], [rows[-1]]))
+
+    boxes = []
+    for top, bottom in zip(starts, ends):
+        if bottom - top + 1 < min_height:
+            continue
+        cols = np.flatnonzero(ink[top:bottom + 1].any(axis=0))
+        boxes.append((
+            max(0, int(cols[0]) - padding),
+            max(0, int(top) - padding),
+            min(width, int(cols[-1]) + 1 + padding),
+            min(height, int(bottom) + 1 + padding),
+        ))
+    return boxes
+
+
+def line_fingerprint(crop):
+    """Satır görüntüsü için küçük gürültülere dayanıklı parmak izi"""
+    gray = np.asarray(crop.convert('L'))
+    # Alt 4 biti atmak sıkıştırma/anti-aliasing titreşimini yok sayar
+    return hashlib.blake2b((gray >> 4).tobytes() + bytes(str(gray.shape), 'ascii'), digest_size=16).digest()
+
+
+class LineTracker:
+    """Bölgeyi metin satırlarına ayırır ve yalnızca değişen satırları OCR'lar.
+
+    Her satırın piksel parmak izi önceki okumalarla karşılaştırılır; bilinen
+    bir satır için OCR çalıştırılmaz, önbellekteki metin kullanılır.
+    """
+
+    def __init__(self, ocr_func, max_cached_lines=512):
+        self.ocr_func = ocr_func
+        self.max_cached_lines = max(1, int(max_cached_lines))
+        self.lines_total = 0
+        self.lines_reused = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read_lines(self, img):
+        """Satır metinlerini yukarıdan aşağıya sırayla döner"""
+        texts = []
+        for box in find_text_lines(img):
+            crop = img.crop(box)
+            key = line_fingerprint(crop)
+            with self._lock:
+                self.lines_total += 1
+                text = self._cache.get(key)
+                if text is not None:
+                    self._cache.move_to_end(key)
+                    self.lines_reused += 1
+            if text is None:
+                text = self.ocr_func(crop).strip()
+                with self._lock:
+                    self._cache[key] = text
+                    while len(self._cache) > self.max_cached_lines:
+                        self._cache.popitem(last=False)
+            if text:
+                texts.append(text)
+        return texts
+
+    def reset(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats_text(self):
+        reuse = self.lines_reused / self.lines_total if self.lines_total else 0.0
+        return f"Satır: {self.lines_reused}/{self.lines_total} tekrar (%{reuse * 100:.0f})"
+
+
+# -----------------------------------------------------
+# KAYDIRMA TAKİBİ
+# -----------------------------------------------------
+def row_signature(gray, blocks=32):
+    """(y, g) gri diziyi satır başına `blocks` sütun bloğunun ortalamasına indirger"""
+    height, width = gray.shape
+    blocks = max(1, min(blocks, width))
+    block_w = width // blocks
+    return gray[:, :blocks * block_w].reshape(height, blocks, block_w).mean(axis=2, dtype=np.float32)
+
+
+def _window_errors(reference, moving, overlap, row_step=1, chunk_bytes=1 << 20):
+    """errors[s] = |moving[s:s + overlap] - reference[:overlap]| ortalaması, s = 0..n.
+
+    Karşılaştırmaya örtüşmenin her `row_step`. satırı girer; adaylar ara
+    dizi `chunk_bytes` boyutunu aşmayacak gruplar halinde kayan pencere
+    görünümleriyle karşılaştırılır, tüm adaylar için tek bir büyük dizi
+    ayrılmaz.
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(moving, overlap, axis=0)[:, :, ::row_step]
+    target = reference[:overlap:row_step].T
+    chunk = max(1, chunk_bytes // max(1, target.nbytes))
+    errors = np.empty(windows.shape[0], dtype=np.float32)
+    for start in range(0, windows.shape[0], chunk):
+        diff = windows[start:start + chunk] - target
+        np.abs(diff, out=diff)
+        errors[start:start + chunk] = diff.mean(axis=(1, 2))
+    return errors
+
+
+def _shift_error(previous, current, shift):
+    """Tek bir kayma adayının tüm satırlarla hesaplanan hatası"""
+    height = previous.shape[0]
+    if shift >= 0:
+        return float(np.abs(previous[shift:] - current[:height - shift]).mean())
+    return float(np.abs(current[-shift:] - previous[:height + shift]).mean())
+
+
+def estimate_scroll(previous, current, max_shift, tolerance=2.0, row_step=4):
+    """İki satır imzası arasındaki dikey kaymayı tahmin eder.
+
+    Pozitif değer içeriğin yukarı kaydığını (yeni satırlar altta), negatif
+    değer aşağı kaydığını gösterir. Tüm adaylar örtüşmenin her `row_step`.
+    satırıyla, parça parça karşılaştırılır (1080 satırlık bölgede birkaç MB);
+    seçilen kayma ve kaymasız yorum tüm satırlarla doğrulanır. Hiçbir kayma
+    `tolerance` içinde eşleşmezse None döner.
+    """
+    height = previous.shape[0]
+    max_shift = max(0, min(int(max_shift), height - 1))
+    if max_shift == 0 or previous.shape != current.shape:
+        return None
+    overlap = height - max_shift
+    row_step = max(1, min(int(row_step), overlap))
+    up = _window_errors(current, previous, overlap, row_step)
+    down = _window_errors(previous, current, overlap, row_step)
+    # İndeks i -> kayma i - max_shift
+    errors = np.concatenate((down[:0:-1], up))
+    best = int(errors.argmin()) - max_shift
+    best_error = _shift_error(previous, current, best)
+    if best_error > tolerance:
+        return None
+    # Eşitlikte (ör. boş satırlar) kaymasız yorumu tercih et
+    if _shift_error(previous, current, 0) <= best_error + 1e-3:
+        return 0
+    return best
+
+
+class ScrollTracker:
+    """Kayan metin bölgelerinde yalnızca yeni açığa çıkan şeridi OCR'lar.
+
+    Önceki okumanın satırları konumlarıyla birlikte tutulur. Yeni karede
+    dikey kayma bulunursa satırlar kaydırılır, dışarı taşanlar atılır ve
+    yalnızca boş kalan şerit okunup birleştirilir. Kayma bulunamazsa tüm
+    kare okunur. Konumlar tutarlı olsun diye kare kırpılmamış olmalıdır.
+    """
+
+    def __init__(self, ocr_func, max_shift_ratio=0.5, tolerance=2.0, margin=2):
+        self.ocr_func = ocr_func
+        self.max_shift_ratio = max_shift_ratio
+        self.tolerance = tolerance
+        self.margin = margin
+        self.frames_total = 0
+        self.frames_scrolled = 0
+        self.rows_total = 0
+        self.rows_read = 0
+        self._signature = None
+        self._lines = []  # [(üst, alt, metin)]
+        self._lock = threading.Lock()
+
+    def _read_region(self, img, top, bottom):
+        """Bölgeyi okur; metin satırları kutularla eşleşirse satır satır konumlandırır"""
+        crop = img.crop((0, top, img.width, bottom)) if (top, bottom) != (0, img.height) else img
+        self.rows_read += bottom - top
+        text = self.ocr_func(crop).strip()
+        if not text:
+            return []
+        texts = [line for line in text.split("\n") if line.strip()]
+        boxes = find_text_lines(crop)
+        if len(boxes) == len(texts):
+            return [(top + box[1], top + box[3], line) for box, line in zip(boxes, texts)]
+        return [(top, bottom, text)]
+
+    def read(self, img):
+        gray = np.asarray(img.convert('L'))
+        signature = row_signature(gray)
+        height = gray.shape[0]
+        with self._lock:
+            previous, lines = self._signature, list(self._lines)
+        self.frames_total += 1
+        self.rows_total += height
+        if previous is not None and previous.shape == signature.shape and \
+                np.abs(previous - signature).max() <= 0.5:
+            # Kare yerinde ve değişmemiş: önceki okuma aynen geçerli
+            return "\n".join(text for _, _, text in lines)
+        shift = None
+        if previous is not None:
+            shift = estimate_scroll(previous, signature, height * self.max_shift_ratio, self.tolerance)
+
+        if not shift:
+            # Kayma yok (içerik yerinde değişti) ya da tutarlı bir kayma bulunamadı
+            lines = self._read_region(img, 0, height)
+        else:
+            self.frames_scrolled += 1
+            moved = [(top - shift, bottom - shift, text) for top, bottom, text in lines]
+            if shift > 0:
+                # Yeni satırlar altta; kenara değen satırlar yarım olabilir, yeniden okunur
+                kept = [line for line in moved if line[0] >= 0 and line[1] <= height - shift - self.margin]
+                strip_top = max((line[1] for line in kept), default=0)
+                lines = kept + self._read_region(img, strip_top, height)
+            else:
+                kept = [line for line in moved if line[1] <= height and line[0] >= -shift + self.margin]
+                strip_bottom = min((line[0] for line in kept), default=height)
+                lines = self._read_region(img, 0, strip_bottom) + kept
+
+        with self._lock:
+            self._signature = signature
+            self._lines = lines
+        return "\n".join(text for _, _, text in lines)
+
+    def reset(self):
+        with self._lock:
+            self._signature = None
+            self._lines = []
+
+    def stats_text(self):
+        read = self.rows_read / self.rows_total if self.rows_total else 0.0
+        return f"Kaydırma: {self.frames_scrolled}/{self.frames_total} kare, alanın %{read * 100:.0f}'i okundu"
@@ -0,0 +1,156 @@
+"""
+Yedekli (hedged) istekler ve arka uç gecikme istatistikleri.
+
+Birincil arka uca istek gönderilir; belirli bir süre içinde geçerli yanıt
+gelmezse ikinci bir arka uca aynı istek gönderilir. İlk geçerli yanıt
+kazanır, diğeri iptal edilir (asenkron isteklerde uçuşta da iptal edilir;
+iş parçacığındaki senkron isteklerin yalnızca sonucu yok sayılır).
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class LatencyStats:
+    """Arka uç başına son N isteğin gecikmesinden p50/p99 hesaplar"""
+
+    def __init__(self, window=200):
+        self.window = window
+        self._samples = {}
+        self.wins = {}
+        self._lock = threading.Lock()
+
+    def record(self, backend, latency_ms):
+        with self._lock:
+            self._samples.setdefault(backend, deque(maxlen=self.window)).append(latency_ms)
+
+    def record_win(self, backend):
+        with self._lock:
+            self.wins[backend] = self.wins.get(backend, 0) + 1
+
+    def percentiles(self, backend):
+        """(p50, p99) milisaniye; örnek yoksa None"""
+        with self._lock:
+            samples = sorted(self._samples.get(backend, ()))
+        if not samples:
+            return None
+        p50 = samples[(len(samples) - 1) // 2]
+        p99 = samples[min(len(samples) - 1, int(round(0.99 * (len(samples) - 1))))]
+        return p50, p99
+
+    def stats_text(self):
+        with self._lock:
+            backends = list(self._samples)
+        parts = []
+        for backend in backends:
+            p50, p99 = self.percentiles(backend)
+            parts.append(f"{backend} p50 {p50:.0f}ms p99 {p99:.0f}ms ({self.wins.get(backend, 0)} kazanç)")
+        return ", ".join(parts)
+
+
+class HedgedCaller:
+    """İki arka ucu yarıştırır.
+
+    Arka uçlar (ad, fonksiyon) ya da (ad, fonksiyon, True) demetleridir.
+    Üçüncü öğe True ise fonksiyon işi başlatıp hemen iptal edilebilir bir
+    concurrent.futures.Future döner (ör. asenkron istemcinin `submit`i);
+    kaybeden istek gerçekten iptal edilir ve iş parçacığı tutulmaz. Diğer
+    fonksiyonlar sınırlı bir iş parçacığı havuzunda çalışır; uçuştaki
+    kaybedenler iptal edilemediğinden havuzda boş iş parçacığı yoksa yedek
+    istek gönderilmez ve birincil istek çağıran iş parçacığında yürütülür.
+    """
+
+    def __init__(self, stats=None, max_workers=4):
+        self.stats = stats if stats is not None else LatencyStats()
+        self.max_workers = max(1, int(max_workers))
+        self.skipped = 0  # Havuz dolu olduğu için gönderilmeyen yedek istekler
+        self._busy = 0  # Havuzda çalışan ya da bekleyen işler (kaybedenler dahil)
+        self._busy_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='hedge')
+
+    def _timed(self, name, func):
+        started = time.perf_counter()
+        try:
+            return func()
+        finally:
+            self.stats.record(name, (time.perf_counter() - started) * 1000)
+
+    def _release(self, _future):
+        with self._busy_lock:
+            self._busy -= 1
+
+    def _start(self, backend):
+        """Arka ucu başlatır; havuz doluysa None döner"""
+        name, func = backend[:2]
+        if len(backend) > 2 and backend[2]:
+            started = time.perf_counter()
+
+            def record(future):
+                if not future.cancelled():
+                    self.stats.record(name, (time.perf_counter() - started) * 1000)
+
+            future = func()
+            future.add_done_callback(record)
+            return future
+        with self._busy_lock:
+            if self._busy >= self.max_workers:
+                return None
+            self._busy += 1
+        future = self._executor.submit(self._timed, name, func)
+        future.add_done_callback(self._release)
+        return future
+
+    def call(self, primary, hedge, hedge_delay_s, is_valid):
+        """İki arka ucu yarıştırır, ilk geçerli sonucu döner.
+
+        Hiçbiri geçerli sonuç vermezse birincilin sonucu (ya da hatası) döner.
+        """
+        primary_name = primary[0]
+        future = self._start(primary)
+        if future is None:
+            # Tüm iş parçacıkları kaybedenlerle meşgul; sıraya girmek yerine yarışsız çalış
+            self.skipped += 1
+            return self._timed(primary_name, primary[1])
+        futures = {future: primary_name}
+        done, _ = wait(futures, timeout=hedge_delay_s)
+        hedged = False
+        fallback = None
+
+        while True:
+            for future in done:
+                name = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                if not isinstance(result, Exception) and is_valid(result):
+                    self.stats.record_win(name)
+                    for loser in futures:
+                        loser.cancel()
+                    return result
+                if name == primary_name:
+                    fallback = result
+            # Birincil zamanında yanıt vermediyse ya da geçersiz döndüyse yedeği gönder
+            if not hedged:
+                hedged = True
+                future = self._start(hedge)
+                if future is None:
+                    self.skipped += 1
+                else:
+                    futures[future] = hedge[0]
+            if not futures:
+                break
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+        if isinstance(fallback, Exception):
+            raise fallback
+        return fallback
+
+    def stats_text(self):
+        with self._busy_lock:
+            busy = self._busy
+        return f"Yarış: {busy}/{self.max_workers} iş parçacığı meşgul, {self.skipped} yedek atlandı"
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,86 @@
+"""
+Çeviri sunucuları için kalıcı (keep-alive) HTTP oturumları.
+
+Her sunucu için tek bir `requests.Session` tutulur; böylece DNS, TCP ve TLS
+kurulumu yalnızca ilk istekte ödenir, sonraki istekler açık bağlantıyı
+yeniden kullanır. requests dışındaki istemciler (ör. asenkron httpx
+istemcisi) `add_stats_source` ile kendi sayaçlarını durum satırına ekler.
+"""
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HTTPSessionPool:
+    def __init__(self, pool_size=4):
+        self.pool_size = max(1, int(pool_size))
+        self._sessions = {}
+        self._stats_sources = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url):
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def session(self, url):
+        """URL'nin sunucusuna ait oturumu döner (gerekirse oluşturur)"""
+        host = self._host(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+            return session
+
+    def post(self, url, **kwargs):
+        return self.session(url).post(url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.session(url).get(url, **kwargs)
+
+    def add_stats_source(self, source):
+        """`source()` aynı biçimde {sunucu: (istek, bağlantı)} döner; sayılar toplanır"""
+        with self._lock:
+            if source not in self._stats_sources:
+                self._stats_sources.append(source)
+
+    def host_stats(self):
+        """{sunucu: (istek sayısı, açılan bağlantı sayısı)}"""
+        stats = {}
+        with self._lock:
+            sessions = list(self._sessions.items())
+            sources = list(self._stats_sources)
+        for host, session in sessions:
+            requests_made = connections = 0
+            for adapter in set(session.adapters.values()):
+                for key in list(adapter.poolmanager.pools.keys()):
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_made += pool.num_requests
+                    connections += pool.num_connections
+            stats[host] = (requests_made, connections)
+        for source in sources:
+            for host, (requests_made, connections) in source().items():
+                previous_requests, previous_connections = stats.get(host, (0, 0))
+                stats[host] = (previous_requests + requests_made, previous_connections + connections)
+        return stats
+
+    def stats_text(self):
+        total_requests = total_connections = 0
+        for requests_made, connections in self.host_stats().values():
+            total_requests += requests_made
+            total_connections += connections
+        return f"HTTP: {total_requests} istek / {total_connections} bağlantı"
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,72 @@
+"""
+Kare parmak izinden OCR metnine önbellek.
+
+Menüler, HUD panelleri ve döngüsel diyalog ekranları dakikalar sonra aynen
+geri döner. Ön işlenmiş bölgenin parmak izi (motor ve dil ile birlikte)
+anahtar olarak kullanılır; daha önce görülmüş bir kare için OCR hiç
+çalıştırılmaz. Bellekte LRU ile tutulur; girdi sayısı ve yaklaşık bellek
+kullanımı sınırlıdır.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+from frame_tools import line_fingerprint
+
+# Anahtar demeti, parmak izi ve OrderedDict düğümü için yaklaşık sabit maliyet
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+class OCRResultCache:
+    def __init__(self, max_entries=256, max_bytes=4 * 2 ** 20):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self.bytes_used = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(img, engine, lang):
+        """Ön işlenmiş görüntü için anahtar; alt 4 bit atıldığından küçük gürültüye dayanıklı"""
+        return line_fingerprint(img), engine, lang
+
+    @staticmethod
+    def _size(text):
+        return sys.getsizeof(text) + _ENTRY_OVERHEAD_BYTES
+
+    def get(self, key):
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def put(self, key, text):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes_used -= self._size(previous)
+            self._entries[key] = text
+            self.bytes_used += self._size(text)
+            while self._entries and (len(self._entries) > self.max_entries or self.bytes_used > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes_used -= self._size(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats_text(self):
+        return (f"OCR önbelleği: {self.hits} isabet / {self.misses} ıska (%{self.hit_rate * 100:.0f}), "
+                f"{len(self._entries)} kare, {self.bytes_used / 1024:.0f} KB")
@@ -0,0 +1,373 @@
+"""
+OCR motorları ve sıcak tutulan motor kayıt defteri.
+
+Her motor sınıfı modeli kurucuda bir kez yükler ve `read(img)` ile PIL
+görüntüsündeki metni döner. Ağır kütüphaneler yalnızca ilgili motor
+yüklenirken import edilir.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# Uygulamanın iki harfli dil kodlarından Tesseract dil paketlerine
+TESSERACT_LANGS = {
+    'en': 'eng', 'tr': 'tur', 'de': 'deu', 'fr': 'fra', 'es': 'spa', 'it': 'ita',
+    'pt': 'por', 'ru': 'rus', 'ja': 'jpn', 'ko': 'kor', 'zh-cn': 'chi_sim', 'zh-tw': 'chi_tra',
+}
+
+
+# -----------------------------------------------------
+# OCR MOTORLARI
+# -----------------------------------------------------
+class _TesseractCAPI:
+    """libtesseract C API'sine ctypes ile bağlanan kalıcı Tesseract oturumu.
+
+    Windows kurulumu (UB Mannheim) tesseract.exe'nin yanında
+    libtesseract-*.dll ile gelir; tesserocr pip ile kurulamadığında da dil
+    modeli bir kez yüklenir ve kare başına süreç başlatılmaz. Kütüphane
+    bulunamazsa ya da başlatılamazsa OSError fırlatır.
+    """
+
+    def __init__(self, lang, psm, oem, tesseract_cmd=None, datapath=None):
+        import ctypes
+        self._ctypes = ctypes
+        lib = ctypes.CDLL(self._find_library(tesseract_cmd))
+        lib.TessBaseAPICreate.restype = ctypes.c_void_p
+        lib.TessBaseAPIInit2.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        lib.TessBaseAPISetPageSegMode.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.TessBaseAPISetImage.argtypes = [ctypes.c_void_p, ctypes.c_char_p] + [ctypes.c_int] * 4
+        lib.TessBaseAPISetSourceResolution.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.TessBaseAPIGetUTF8Text.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p  # TessDeleteText ile serbest bırakılır
+        lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIEnd.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIDelete.argtypes = [ctypes.c_void_p]
+        self._lib = lib
+        self._handle = lib.TessBaseAPICreate()
+        path = datapath.encode() if datapath else None
+        if lib.TessBaseAPIInit2(self._handle, path, lang.encode(), oem) != 0:
+            self.close()
+            raise OSError(f"libtesseract '{lang}' dil modeliyle başlatılamadı")
+        lib.TessBaseAPISetPageSegMode(self._handle, psm)
+
+    @staticmethod
+    def _find_library(tesseract_cmd):
+        import ctypes.util
+        import glob
+        if tesseract_cmd:
+            folder = os.path.dirname(tesseract_cmd)
+            for pattern in ('libtesseract*.dll', 'libtesseract*.so*', 'libtesseract*.dylib'):
+                found = sorted(glob.glob(os.path.join(folder, pattern)))
+                if found:
+                    return found[-1]
+        name = ctypes.util.find_library('tesseract')
+        if name is None:
+            raise OSError("libtesseract bulunamadı")
+        return name
+
+    def read(self, img):
+        """8 bit gri tonlamalı PIL görüntüsünü okur"""
+        data = img.tobytes()
+        self._lib.TessBaseAPISetImage(self._handle, data, img.width, img.height, 1, img.width)
+        self._lib.TessBaseAPISetSourceResolution(self._handle, 70)  # pytesseract'ın varsayımıyla aynı
+        text = self._lib.TessBaseAPIGetUTF8Text(self._handle)
+        if not text:
+            return ""
+        try:
+            return self._ctypes.string_at(text).decode('utf-8', 'replace')
+        finally:
+            self._lib.TessDeleteText(text)
+
+    def close(self):
+        if self._handle:
+            self._lib.TessBaseAPIEnd(self._handle)
+            self._lib.TessBaseAPIDelete(self._handle)
+            self._handle = None
+
+
+class TesseractEngine:
+    """Tesseract OCR.
+
+    Dil modelini bir kez yükleyen kalıcı bir oturum tercih edilir: önce
+    tesserocr, o yoksa libtesseract C API'si (ctypes). İkisi de yoksa
+    pytesseract ile her karede tesseract süreci başlatılır; hangi arka ucun
+    kullanıldığı `backend` ile durum satırında gösterilir.
+    Girdi gri tonlamalı olarak verilir; PSM/OEM ayarlanabilir.
+    """
+    language_specific = True
+
+    def __init__(self, lang, psm=6, oem=3):
+        self.lang = TESSERACT_LANGS.get(lang, lang)
+        self.psm = int(psm)
+        self.oem = int(oem)
+        self._lock = threading.Lock()
+        self._api = None
+        self._capi = None
+        self._pytesseract = None
+        # Tesseract kurulumunun yanındaki tessdata klasörünü ve kütüphaneyi tercih et
+        tesseract_cmd = tessdata = None
+        try:
+            import pytesseract
+            tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
+            folder = os.path.join(os.path.dirname(tesseract_cmd), 'tessdata')
+            if os.path.isdir(folder):
+                tessdata = folder
+        except ImportError:
+            pytesseract = None
+        try:
+            import tesserocr
+        except ImportError:
+            tesserocr = None
+        if tesserocr is not None:
+            kwargs = {'path': tessdata} if tessdata else {}
+            # tesserocr.PSM / OEM yalnızca sabit tutan sınıflardır; değerler düz tam sayıdır
+            self._api = tesserocr.PyTessBaseAPI(lang=self.lang, psm=self.psm, oem=self.oem, **kwargs)
+            self.backend = 'tesserocr'
+            return
+        try:
+            self._capi = _TesseractCAPI(self.lang, self.psm, self.oem, tesseract_cmd, tessdata)
+            self.backend = 'libtesseract'
+            return
+        except OSError as e:
+            if pytesseract is None:
+                raise
+            print(f"Kalıcı Tesseract oturumu açılamadı, kare başına süreç kullanılacak: {e}")
+        self._pytesseract = pytesseract
+        self.backend = 'pytesseract'
+
+    def read(self, img):
+        if img.mode != 'L':
+            img = img.convert('L')
+        if self._pytesseract is None:
+            with self._lock:
+                if self._api is not None:
+                    self._api.SetImage(img)
+                    return self._api.GetUTF8Text().strip()
+                if self._capi is not None:
+                    return self._capi.read(img).strip()
+                return ""  # Oturum close() ile kapatıldı
+        config = f"--psm {self.psm} --oem {self.oem}"
+        return self._pytesseract.image_to_string(img, lang=self.lang, config=config).strip()
+
+    def close(self):
+        with self._lock:
+            if self._api is not None:
+                self._api.End()
+                self._api = None
+            if self._capi is not None:
+                self._capi.close()
+                self._capi = None
+
+
+class EasyOCREngine:
+    language_specific = True
+
+    def __init__(self, lang):
+        import easyocr
+        import numpy as np
+        self._np = np
+        self.reader = easyocr.Reader([lang], gpu=False)
+
+    def read(self, img):
+        results = self.reader.readtext(self._np.array(img), detail=0)
+        return " ".join(results).strip()
+
+
+class TrOCREngine:
+    language_specific = False
+    MODEL_NAME = "microsoft/trocr-base-handwritten"
+
+    def __init__(self, lang=None):
+        from transformers import TrOCRProcessor, VisionEncoderDecoderModel
+        self.processor = TrOCRProcessor.from_pretrained(self.MODEL_NAME)
+        self.model = VisionEncoderDecoderModel.from_pretrained(self.MODEL_NAME)
+
+    def read(self, img):
+        # Ön işlenmiş kareler gri tonlamalı gelebilir; işlemci 3 kanal bekler
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        pixel_values = self.processor(images=img, return_tensors="pt").pixel_values
+        generated_ids = self.model.generate(pixel_values)
+        return self.processor.batch_decode(generated_ids, skip_special_tokens=True)[0].strip()
+
+
+class DocTREngine:
+    language_specific = False
+
+    def __init__(self, lang=None):
+        import numpy as np
+        from doctr.models import ocr_predictor
+        self._np = np
+        self.predictor = ocr_predictor(pretrained=True)
+
+    def read(self, img):
+        # Tahmin edici (H, W, 3) uint8 dizileri doğrudan kabul eder;
+        # geçici PNG dosyasına yazıp geri okumaya gerek yok.
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        page = self._np.asarray(img)
+        return self.predictor([page]).render()
+
+
+OCR_ENGINES = {
+    'tesseract': TesseractEngine,
+    'easyocr': EasyOCREngine,
+    'trocr': TrOCREngine,
+    'doctr': DocTREngine,
+}
+
+
+# -----------------------------------------------------
+# MOTOR KAYIT DEFTERİ
+# -----------------------------------------------------
+class _EngineSlot:
+    def __init__(self):
+        self.engine = None
+        self.error = None
+        self.failed_at = None
+        self.load_seconds = None
+        self.users = 0  # `acquire` ile motoru kullanan çağrı sayısı
+        self.retired = False  # Havuzdan çıkarıldı; son kullanıcı bırakınca kapatılır
+        self.ready = threading.Event()
+
+    def close(self):
+        close = getattr(self.engine, 'close', None)
+        if close is not None:
+            close()
+
+
+class OCREngineRegistry:
+    """(motor, dil) anahtarlı, LRU ile sınırlı sıcak motor havuzu.
+
+    `preload` motoru arka planda yükler; `get` / `acquire` motor hazır olana
+    kadar bekler. Aynı motor iki kez yüklenmez. Yüklenemeyen motor hatası
+    saklanır: `get` onu her karede yeniden yüklemeye çalışmaz, `preload`
+    çağrıldığında ya da `retry_after_s` geçtikten sonra yeniden denenir.
+    Yüklenmekte olan ya da `acquire` ile kullanımda olan motor havuzdan
+    çıkarılsa bile kullanım bitene kadar kapatılmaz.
+    """
+
+    def __init__(self, engines=None, max_warm=2, options=None, retry_after_s=30.0):
+        self.engines = dict(OCR_ENGINES if engines is None else engines)
+        self.max_warm = max(1, int(max_warm))
+        self.options = dict(options or {})  # motor adı -> kurucu parametreleri
+        self.retry_after_s = retry_after_s
+        self._slots = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, name, lang):
+        engine_cls = self.engines[name]
+        return (name, lang if engine_cls.language_specific else None)
+
+    def _load(self, key, slot):
+        name, lang = key
+        started = time.perf_counter()
+        try:
+            slot.engine = self.engines[name](lang, **self.options.get(name, {}))
+            print(f"{name} OCR motoru yüklendi ({time.perf_counter() - started:.1f} sn)")
+        except Exception as e:
+            slot.error = e
+            slot.failed_at = time.monotonic()
+            print(f"{name} OCR motoru yüklenemedi: {e}")
+        slot.load_seconds = time.perf_counter() - started
+        slot.ready.set()
+
+    def _evict(self):
+        """En uzun süredir kullanılmayan hazır ve boşta motorları bırakır (kilit altında çağrılır)"""
+        closing = []
+        for key in list(self._slots):
+            if len(self._slots) <= self.max_warm:
+                break
+            slot = self._slots[key]
+            if not slot.ready.is_set():
+                continue  # Yükleme iş parçacığı hâlâ bu yuvaya yazıyor
+            del self._slots[key]
+            slot.retired = True
+            if slot.users == 0:
+                closing.append(slot)
+        return closing
+
+    def _slot(self, name, lang, background, retry, use=False):
+        key = self._key(name, lang)
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is not None:
+                self._slots.move_to_end(key)
+                if slot.error is None or not (
+                    retry or time.monotonic() - slot.failed_at >= self.retry_after_s
+                ):
+                    slot.users += int(use)
+                    return slot
+            slot = _EngineSlot()
+            slot.users += int(use)
+            self._slots[key] = slot
+            closing = self._evict()
+        for evicted in closing:
+            evicted.close()
+        if background:
+            threading.Thread(target=self._load, args=(key, slot), daemon=True).start()
+        else:
+            self._load(key, slot)
+        return slot
+
+    def preload(self, name, lang):
+        """Motoru arka planda yüklemeye başlar (zaten yüklüyse bir şey yapmaz, hatalıysa yeniden dener)"""
+        if name in self.engines:
+            self._slot(name, lang, background=True, retry=True)
+
+    def get(self, name, lang, timeout=None):
+        """Hazır motoru döner; yükleniyorsa bekler. Yüklenemezse None.
+
+        Dönen motor daha sonra havuzdan çıkarılıp kapatılabilir; başka iş
+        parçacıklarıyla paylaşılan kullanımda `acquire` tercih edilmeli.
+        """
+        if name not in self.engines:
+            return None
+        slot = self._slot(name, lang, background=False, retry=False)
+        if not slot.ready.wait(timeout):
+            return None
+        return slot.engine
+
+    @contextmanager
+    def acquire(self, name, lang, timeout=None):
+        """`with` bloğu boyunca motoru kapatılmaya karşı tutar; yüklenemezse None verir"""
+        if name not in self.engines:
+            yield None
+            return
+        slot = self._slot(name, lang, background=False, retry=False, use=True)
+        try:
+            yield slot.engine if slot.ready.wait(timeout) else None
+        finally:
+            with self._lock:
+                slot.users -= 1
+                close = slot.retired and slot.users == 0
+            if close:
+                slot.close()
+
+    def status(self, name, lang):
+        """('hazır' | 'yükleniyor' | 'hata' | 'yüklü değil', yükleme süresi)"""
+        if name not in self.engines:
+            return 'yüklü değil', None
+        with self._lock:
+            slot = self._slots.get(self._key(name, lang))
+        if slot is None:
+            return 'yüklü değil', None
+        if not slot.ready.is_set():
+            return 'yükleniyor', None
+        if slot.error is not None:
+            return 'hata', slot.load_seconds
+        return 'hazır', slot.load_seconds
+
+    def stats_text(self, name, lang):
+        state, seconds = self.status(name, lang)
+        if seconds is None:
+            return f"Motor: {state}"
+        with self._lock:
+            slot = self._slots.get(self._key(name, lang))
+        backend = getattr(slot.engine, 'backend', None) if slot is not None else None
+        if backend:
+            # ör. "pytesseract": kare başına süreç başlatılıyor
+            return f"Motor: {state}, {backend} ({seconds:.1f} sn)"
+        return f"Motor: {state} ({seconds:.1f} sn)"
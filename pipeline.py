@@ -0,0 +1,227 @@
+"""
+Yakalama -> OCR -> çeviri -> gösterim aşamalarını ayrı iş parçacıklarında
+çalıştıran boru hattı.
+
+Aşamalar arasında sınırlı kuyruklar vardır. Kuyruk dolduğunda en eski öğe
+atılır; böylece yavaş bir aşama (ör. 8 sn zaman aşımlı LibreTranslate)
+eski karelerin birikmesine yol açmaz, her zaman en yeni içerik işlenir.
+Yakalama sıklığını AdaptiveScheduler belirler.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError
+
+
+class DropOldestQueue:
+    """Dolunca en eski öğeyi atan, iş parçacığı güvenli sınırlı kuyruk"""
+
+    def __init__(self, maxsize=1):
+        self.maxsize = max(1, int(maxsize))
+        self.dropped = 0
+        self._items = deque()
+        self._cond = threading.Condition()
+
+    def put(self, item):
+        with self._cond:
+            while len(self._items) >= self.maxsize:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """Bir öğe döner; zaman aşımında None"""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            return self._items.popleft()
+
+    def clear(self):
+        with self._cond:
+            self._items.clear()
+
+    def qsize(self):
+        with self._cond:
+            return len(self._items)
+
+
+class PipelineStage:
+    """Tek bir boru hattı aşaması.
+
+    `handler(payload)` bir sonraki aşamaya gidecek değeri döner; None dönerse
+    öğe burada biter (ör. OCR metni değişmedi). İşleyici `CancelledError`
+    fırlatırsa (ör. `flush` uçuştaki isteği iptal etti) öğe hata sayılmadan
+    atılır. Uzun süren işleyiciler `current_superseded()` ile erken çıkabilir.
+    """
+
+    def __init__(self, name, handler, maxsize=1):
+        self.name = name
+        self.handler = handler
+        self.queue = DropOldestQueue(maxsize)
+        self.next_stage = None
+        self.sink = None
+        self.processed = 0
+        self.errors = 0
+        self.latency_ms = 0.0  # Üssel hareketli ortalama
+        self._thread = None
+        self._stop = threading.Event()
+        self._pipeline = None
+        self._current_seq = None
+
+    def submit(self, seq, payload):
+        self.queue.put((seq, payload))
+
+    def current_superseded(self):
+        """Şu an işlenen öğe `flush` ile geçersiz kılındıysa True"""
+        seq = self._current_seq
+        return seq is not None and self._pipeline is not None and self._pipeline.is_superseded(seq)
+
+    def _run(self):
+        while not self._stop.is_set():
+            item = self.queue.get(timeout=0.2)
+            if item is None:
+                continue
+            seq, payload = item
+            # Bu öğe işlenmeden önce daha yenisi yakalandıysa boşuna çalışma
+            if self._pipeline is not None and self._pipeline.is_superseded(seq):
+                self.queue.dropped += 1
+                continue
+            started = time.perf_counter()
+            self._current_seq = seq
+            try:
+                result = self.handler(payload)
+            except CancelledError:
+                self.queue.dropped += 1
+                continue
+            except Exception as e:
+                self.errors += 1
+                print(f"Boru hattı aşaması '{self.name}' hatası: {e}")
+                continue
+            finally:
+                self._current_seq = None
+            elapsed = (time.perf_counter() - started) * 1000
+            self.latency_ms = elapsed if not self.processed else 0.8 * self.latency_ms + 0.2 * elapsed
+            self.processed += 1
+            if result is None:
+                continue
+            if self._pipeline is not None and self._pipeline.is_superseded(seq):
+                self.queue.dropped += 1  # Sonuç hazırlanırken flush edildi
+                continue
+            if self.next_stage is not None:
+                self.next_stage.submit(seq, result)
+            elif self.sink is not None:
+                self._pipeline.deliver(seq, result, self.sink)
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"stage-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats_text(self):
+        return f"{self.name}: {self.latency_ms:.0f}ms k{self.queue.qsize()} a{self.queue.dropped}"
+
+
+class Pipeline:
+    """Aşamaları sırayla birbirine bağlar ve sıra numarasıyla eskiyi eler.
+
+    Her gönderilen öğeye artan bir sıra numarası verilir. `sink` yalnızca
+    şimdiye kadar teslim edilenlerden daha yeni sonuçlar için çağrılır.
+    """
+
+    def __init__(self, stages, sink):
+        self.stages = list(stages)
+        for stage, nxt in zip(self.stages, self.stages[1:]):
+            stage.next_stage = nxt
+        for stage in self.stages:
+            stage._pipeline = self
+        self.stages[-1].sink = sink
+        self._seq = 0
+        self._delivered_seq = 0
+        self._stale_before = 0
+        self._flush_hooks = []
+        self._lock = threading.Lock()
+
+    def submit(self, payload):
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        self.stages[0].submit(seq, payload)
+        return seq
+
+    def is_superseded(self, seq):
+        return seq < self._stale_before
+
+    def deliver(self, seq, result, sink):
+        with self._lock:
+            if seq <= self._delivered_seq or seq < self._stale_before:
+                return
+            self._delivered_seq = seq
+        sink(result)
+
+    def add_flush_hook(self, callback):
+        """`flush` sırasında çağrılır; uçuştaki istekleri (ör. ağ çevirisi) iptal etmek için"""
+        self._flush_hooks.append(callback)
+
+    def flush(self):
+        """Bekleyen tüm öğeleri ve uçuştaki sonuçları geçersiz kılar"""
+        with self._lock:
+            self._stale_before = self._seq + 1
+        for stage in self.stages:
+            stage.queue.clear()
+        for callback in self._flush_hooks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Boru hattı iptal hatası: {e}")
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def stop(self):
+        for stage in self.stages:
+            stage.stop()
+
+    def stats_text(self):
+        return " | ".join(stage.stats_text() for stage in self.stages)
+
+    def slowest_latency_ms(self):
+        """En yavaş aşamanın ortalama gecikmesi: boru hattının boşaltma hızını belirler"""
+        return max((stage.latency_ms for stage in self.stages), default=0.0)
+
+
+class AdaptiveScheduler:
+    """Yakalama aralığını bölgenin değişim hızına göre ayarlar.
+
+    Bölge değiştikçe aralık en kısa sınıra iner; durağan karelerde üssel
+    olarak en uzun sınıra kadar açılır. Aralık hiçbir zaman boru hattının
+    en yavaş aşamasından ve CPU bütçesinin izin verdiğinden kısa olmaz.
+    `cpu_budget` tek çekirdeğin yakalama+karşılaştırma için ayrılan oranıdır.
+    """
+
+    def __init__(self, min_ms=100, max_ms=2000, cpu_budget=0.25, backoff=1.5):
+        self.backoff = backoff
+        self.interval_ms = min_ms
+        self.configure(min_ms, max_ms, cpu_budget)
+
+    def configure(self, min_ms, max_ms, cpu_budget):
+        self.min_ms = max(1, int(min_ms))
+        self.max_ms = max(self.min_ms, int(max_ms))
+        self.cpu_budget = min(1.0, max(0.01, float(cpu_budget)))
+        self.interval_ms = min(max(self.interval_ms, self.min_ms), self.max_ms)
+
+    def next_interval_ms(self, changed, capture_ms, pipeline_ms):
+        """Bir sonraki yakalamaya kadar beklenecek süre (ms)"""
+        if changed:
+            target = self.min_ms
+        else:
+            target = self.interval_ms * self.backoff
+        floor = max(self.min_ms, pipeline_ms, capture_ms / self.cpu_budget - capture_ms)
+        self.interval_ms = max(floor, min(self.max_ms, target))
+        return self.interval_ms
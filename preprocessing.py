@@ -0,0 +1,211 @@
+"""
+OCR öncesi görüntü ön işleme.
+
+Yakalanan (yükseklik, genişlik, 3) RGB kare sırasıyla gri tonlamaya
+çevrilir, kontrastı gerilir, açık zemin üzerinde koyu metin olacak şekilde
+çevrilir, isteğe bağlı olarak uyarlamalı eşikle ikili hale getirilir,
+metnin sınır kutusuna kırpılır ve tam sayı katıyla büyütülür. Tüm adımlar
+vektörel NumPy işlemleridir; ara diziler kare boyutu değişmedikçe yeniden
+kullanılır. Daha küçük ve sade girdi her OCR motorunu hızlandırır.
+"""
+import threading
+import time
+
+import numpy as np
+
+STEP_NAMES = {
+    'gray': 'gri',
+    'normalize': 'kontrast',
+    'threshold': 'eşik',
+    'crop': 'kırp',
+    'upscale': 'büyüt',
+}
+
+
+class Preprocessor:
+    """Yapılandırılabilir ön işleme adımları ve adım başına süre ölçümü.
+
+    `process(frame)` uint8 dizi döner (gri tonlama açıksa 2 boyutlu);
+    karede metin yoksa None döner. Dönen dizi her çağrıda yeni ayrılır,
+    ara tamponlar ise örnek içinde tutulur; bu yüzden tek iş parçacığından
+    çağrılmalıdır. Tam kare ve kırpılmış boyutta çalışan adımlar ayrı
+    tampon adları kullanır; aksi halde her karede yeniden ayrılırlardı.
+    """
+
+    def __init__(self, grayscale=True, normalize=True, threshold=False, threshold_window=31,
+                 threshold_offset=10, upscale=1, crop=True, crop_padding=8, contrast=40):
+        self.configure(grayscale, normalize, threshold, threshold_window,
+                       threshold_offset, upscale, crop, crop_padding, contrast)
+        self.timings_ms = {}  # Adım başına üssel hareketli ortalama
+        self.frames = 0
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def configure(self, grayscale=True, normalize=True, threshold=False, threshold_window=31,
+                  threshold_offset=10, upscale=1, crop=True, crop_padding=8, contrast=40):
+        self.grayscale = bool(grayscale)
+        # Eşik ve kırpma gri tonlamalı görüntü üzerinde çalışır
+        self.normalize = bool(normalize) and self.grayscale
+        self.threshold = bool(threshold) and self.grayscale
+        self.threshold_radius = max(1, int(threshold_window) // 2)
+        self.threshold_offset = min(99, max(0, int(threshold_offset)))
+        self.upscale = max(1, int(upscale))
+        self.crop = bool(crop) and self.grayscale
+        self.crop_padding = max(0, int(crop_padding))
+        self.contrast = max(0, int(contrast))
+
+    def _buffer(self, name, shape, dtype):
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = self._buffers[name] = np.empty(shape, dtype=dtype)
+        return buf
+
+    def _record(self, step, started):
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._lock:
+            previous = self.timings_ms.get(step)
+            self.timings_ms[step] = elapsed if previous is None else 0.8 * previous + 0.2 * elapsed
+        return time.perf_counter()
+
+    # -----------------------------------------------------
+    # ADIMLAR
+    # -----------------------------------------------------
+    def _gray(self, frame):
+        """ITU-R 601 ağırlıklarıyla (77, 150, 29) / 256 tam sayı gri tonlama"""
+        height, width = frame.shape[:2]
+        acc = self._buffer('acc', (height, width), np.uint16)
+        tmp = self._buffer('tmp', (height, width), np.uint16)
+        np.multiply(frame[:, :, 0], 77, out=acc, dtype=np.uint16)
+        np.multiply(frame[:, :, 1], 150, out=tmp, dtype=np.uint16)
+        np.add(acc, tmp, out=acc)
+        np.multiply(frame[:, :, 2], 29, out=tmp, dtype=np.uint16)
+        np.add(acc, tmp, out=acc)
+        np.right_shift(acc, 8, out=acc)
+        gray = self._buffer('gray', (height, width), np.uint8)
+        np.copyto(gray, acc, casting='unsafe')
+        return gray
+
+    def _normalize(self, gray):
+        """En koyu ve en açık tonu 0..255 aralığına gerer"""
+        low, high = int(gray.min()), int(gray.max())
+        if high > low and (low > 0 or high < 255):
+            acc = self._buffer('acc', gray.shape, np.uint16)
+            np.subtract(gray, low, out=acc, dtype=np.uint16)
+            np.multiply(acc, 255, out=acc)
+            np.floor_divide(acc, high - low, out=acc)
+            np.copyto(gray, acc, casting='unsafe')
+        return gray
+
+    def _polarity(self, gray):
+        # Arka plan en sık görülen gri tondur; koyu zeminde açık metni ters çevir.
+        # bincount girdiyi intp'ye çevirdiğinden seyreltilmiş örnek yeterli.
+        background = int(np.bincount(gray[::4, ::4].ravel(), minlength=256).argmax())
+        if background < 128:
+            np.subtract(255, gray, out=gray)
+            background = 255 - background
+        return background
+
+    def _threshold(self, gray):
+        """Yerel ortalamadan `threshold_offset` yüzde koyu pikseller metin (0), geri kalanı zemin (255).
+
+        Pencere toplamları integral görüntüden dört dilimle hesaplanır.
+        """
+        height, width = gray.shape
+        radius = self.threshold_radius
+        window = 2 * radius + 1
+        padded = np.pad(gray, radius, mode='edge')
+        integral = self._buffer('integral', (height + window, width + window), np.int64)
+        integral[0, :] = 0
+        integral[:, 0] = 0
+        body = integral[1:, 1:]
+        np.cumsum(padded, axis=0, dtype=np.int64, out=body)
+        np.cumsum(body, axis=1, out=body)
+
+        sums = self._buffer('sums', (height, width), np.int64)
+        np.subtract(integral[window:, window:], integral[:-window, window:], out=sums)
+        np.subtract(sums, integral[window:, :-window], out=sums)
+        np.add(sums, integral[:-window, :-window], out=sums)
+        np.multiply(sums, 100 - self.threshold_offset, out=sums)
+
+        scaled = self._buffer('scaled', (height, width), np.int64)
+        np.multiply(gray, window * window * 100, out=scaled, dtype=np.int64)
+        ink = self._buffer('threshold_ink', (height, width), np.bool_)
+        np.less(scaled, sums, out=ink)
+        gray.fill(255)
+        gray[ink] = 0
+        return gray
+
+    def _crop_box(self, gray, background):
+        """Zeminden `contrast` kadar farklı piksellerin sınır kutusu; yoksa None"""
+        height, width = gray.shape
+        diff = self._buffer('diff', (height, width), np.int16)
+        np.subtract(gray, background, out=diff, dtype=np.int16)
+        np.abs(diff, out=diff)
+        ink = self._buffer('crop_ink', (height, width), np.bool_)
+        np.greater(diff, self.contrast, out=ink)
+        rows = np.flatnonzero(ink.any(axis=1))
+        if rows.size == 0:
+            return None
+        cols = np.flatnonzero(ink.any(axis=0))
+        pad = self.crop_padding
+        return (
+            max(0, int(rows[0]) - pad), min(height, int(rows[-1]) + 1 + pad),
+            max(0, int(cols[0]) - pad), min(width, int(cols[-1]) + 1 + pad),
+        )
+
+    def _upscale(self, img):
+        """En yakın komşu ile tam sayı büyütme: tek ayırma, yayınlı atama"""
+        scale = self.upscale
+        height, width = img.shape[:2]
+        out = np.empty((height * scale, width * scale) + img.shape[2:], dtype=np.uint8)
+        view = out.reshape((height, scale, width, scale) + img.shape[2:])
+        view[...] = img[:, None, :, None]
+        return out
+
+    # -----------------------------------------------------
+    # ÇALIŞTIRMA
+    # -----------------------------------------------------
+    def process(self, frame):
+        started = time.perf_counter()
+        img = frame
+        if self.grayscale:
+            img = self._gray(frame)
+            started = self._record('gray', started)
+        if self.normalize:
+            img = self._normalize(img)
+        background = self._polarity(img) if self.grayscale else None
+        if self.grayscale:
+            started = self._record('normalize', started)
+
+        box = None
+        if self.crop:
+            # Kutu eşikten önce bulunur; uyarlamalı eşik düz zeminde de gürültü bırakabilir
+            box = self._crop_box(img, background)
+            started = self._record('crop', started)
+            if box is None:
+                with self._lock:
+                    self.frames += 1
+                return None
+            top, bottom, left, right = box
+            img = img[top:bottom, left:right]
+
+        if self.threshold:
+            img = self._threshold(np.ascontiguousarray(img))
+            started = self._record('threshold', started)
+
+        if self.upscale > 1:
+            img = self._upscale(img)
+            self._record('upscale', started)
+        else:
+            img = img.copy()  # Ara tampon bir sonraki karede üzerine yazılır
+        with self._lock:
+            self.frames += 1
+        return img
+
+    def stats_text(self):
+        with self._lock:
+            timings = dict(self.timings_ms)
+        if not timings:
+            return "Ön işleme: -"
+        parts = [f"{STEP_NAMES[step]} {ms:.1f}" for step, ms in timings.items()]
+        return f"Ön işleme: {' | '.join(parts)} ms"
@@ -0,0 +1,149 @@
+"""
+LibreTranslate sunucu havuzu: gecikme ve hata takibine göre sunucu seçimi.
+
+Her sunucu için üssel hareketli ortalama (EWMA) gecikme, hata oranı ve 429
+(kota) sayısı tutulur. İstekler en hızlı sağlıklı sunucuya gider. Üst üste
+hata veren sunucunun devre kesicisi açılır ve üssel artan bir süre boyunca
+kullanılmaz; süre dolunca arka planda yoklanır.
+"""
+import threading
+import time
+
+
+class ServerHealth:
+    def __init__(self, url, order):
+        self.url = url
+        self.order = order  # Listede önce gelen sunucu eşitlikte tercih edilir
+        self.ewma_ms = None
+        self.successes = 0
+        self.failures = 0
+        self.quota_hits = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.error_rate = 0.0  # Son isteklerin hata oranı (EWMA)
+
+    def is_open(self, now):
+        return now < self.open_until
+
+    def score(self):
+        # Hata oranı yüksek sunucuyu gecikmesi düşük olsa da geriye it
+        latency = self.ewma_ms if self.ewma_ms is not None else 1000.0
+        return latency * (1.0 + 4.0 * self.error_rate)
+
+
+class ServerPool:
+    def __init__(self, urls, alpha=0.3, failure_threshold=2, base_backoff_s=5.0,
+                 max_backoff_s=300.0, quota_backoff_s=60.0, clock=time.monotonic):
+        self.alpha = alpha
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.quota_backoff_s = quota_backoff_s
+        self.clock = clock
+        self.servers = {url: ServerHealth(url, i) for i, url in enumerate(urls)}
+        self._lock = threading.Lock()
+        self._probe_thread = None
+        self._stop = threading.Event()
+
+    def candidates(self):
+        """Denenecek sunucuları en iyiden kötüye sıralı döner.
+
+        Hepsinin devre kesicisi açıksa, en erken açılacak olan tek başına
+        döner; böylece çeviri hiç denenmeden başarısız olmaz.
+        """
+        now = self.clock()
+        with self._lock:
+            healthy = [s for s in self.servers.values() if not s.is_open(now)]
+            if not healthy:
+                soonest = min(self.servers.values(), key=lambda s: s.open_until)
+                return [soonest.url]
+            healthy.sort(key=lambda s: (s.score(), s.order))
+            return [s.url for s in healthy]
+
+    def record_success(self, url, latency_ms):
+        with self._lock:
+            server = self.servers[url]
+            server.successes += 1
+            server.consecutive_failures = 0
+            server.open_until = 0.0
+            if server.ewma_ms is None:
+                server.ewma_ms = latency_ms
+            else:
+                server.ewma_ms = (1 - self.alpha) * server.ewma_ms + self.alpha * latency_ms
+            server.error_rate *= (1 - self.alpha)
+
+    def record_failure(self, url, quota=False):
+        """Başarısız isteği kaydeder; 429 kotası devre kesiciyi hemen açar"""
+        with self._lock:
+            server = self.servers[url]
+            server.failures += 1
+            server.consecutive_failures += 1
+            server.error_rate = (1 - self.alpha) * server.error_rate + self.alpha
+            now = self.clock()
+            if quota:
+                server.quota_hits += 1
+                server.open_until = now + self.quota_backoff_s
+            elif server.consecutive_failures >= self.failure_threshold:
+                exponent = server.consecutive_failures - self.failure_threshold
+                backoff = min(self.max_backoff_s, self.base_backoff_s * (2 ** exponent))
+                server.open_until = now + backoff
+
+    # -----------------------------------------------------
+    # ARKA PLAN YOKLAMA
+    # -----------------------------------------------------
+    def due_for_probe(self):
+        """Devre kesicisi süresi dolmuş ya da hiç ölçülmemiş sunucular.
+
+        Devre kesicisi açık sunucu, hiç başarılı olmamış olsa da süre
+        dolana kadar yoklanmaz; ölü sunuculara geri çekilme uygulanır.
+        """
+        now = self.clock()
+        with self._lock:
+            return [
+                s.url for s in self.servers.values()
+                if not s.is_open(now) and (s.open_until or s.ewma_ms is None)
+            ]
+
+    def probe_once(self, probe):
+        """`probe(url)` HTTP durum kodunu döner; None dönerse yoklama atlanmış sayılır"""
+        for url in self.due_for_probe():
+            started = time.perf_counter()
+            try:
+                status = probe(url)
+            except Exception:
+                status = 0
+            if status is None:
+                continue
+            if status == 200:
+                self.record_success(url, (time.perf_counter() - started) * 1000)
+            else:
+                self.record_failure(url, quota=status == 429)
+
+    def start_probing(self, probe, interval_s=10.0):
+        if self._probe_thread is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            # İlk yoklama hemen: hiç ölçülmemiş sunucular da sıralamaya girsin
+            self.probe_once(probe)
+            while not self._stop.wait(interval_s):
+                self.probe_once(probe)
+
+        self._probe_thread = threading.Thread(target=loop, name="libre-probe", daemon=True)
+        self._probe_thread.start()
+
+    def stop_probing(self):
+        self._stop.set()
+        self._probe_thread = None
+
+    def stats_text(self):
+        now = self.clock()
+        with self._lock:
+            healthy = sum(1 for s in self.servers.values() if not s.is_open(now))
+            measured = [s for s in self.servers.values() if s.ewma_ms is not None and not s.is_open(now)]
+        best = min(measured, key=lambda s: (s.score(), s.order), default=None)
+        text = f"Sunucu: {healthy}/{len(self.servers)} sağlıklı"
+        if best is not None:
+            text += f", en iyi {best.ewma_ms:.0f}ms"
+        return text
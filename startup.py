@@ -0,0 +1,64 @@
+"""
+Hafif başlangıç yardımcıları.
+
+Ağır OCR/ML kütüphaneleri (transformers, doctr, easyocr, argostranslate)
+başlangıçta import edilmez; kurulu olup olmadıkları `importlib.util.find_spec`
+ile modül yüklenmeden yoklanır. Gerçek import, seçilen motor ya da servis ilk
+kez gerektiğinde yapılır. `StartupTimer` başlangıcın aşamalarını ölçer.
+"""
+import importlib.metadata
+import importlib.util
+import re
+import time
+
+# Seçilebilir her OCR motoru ve çeviri servisinin gerektirdiği modüller
+OCR_ENGINE_MODULES = {
+    'tesseract': ('pytesseract',),
+    'easyocr': ('easyocr',),
+    'trocr': ('transformers', 'torch'),
+    'doctr': ('doctr',),
+}
+TRANSLATOR_MODULES = {
+    'google': ('googletrans',),
+    'libretranslate': ('requests',),
+    'argos': ('argostranslate',),
+}
+# Asenkron istemci istek `extensions` parametresi ve httpcore `trace` kancasını kullanır;
+# googletrans==4.0.0-rc1'in sabitlediği httpx 0.13 bunları desteklemez
+ASYNC_HTTPX_MIN_VERSION = (0, 21)
+
+
+def module_available(*names):
+    """Modüllerin hepsi kuruluysa True döner; hiçbirini import etmez"""
+    for name in names:
+        try:
+            if importlib.util.find_spec(name) is None:
+                return False
+        except (ImportError, ValueError):
+            return False
+    return True
+
+
+def module_version_at_least(name, minimum):
+    """Kurulu dağıtımın sürümü `minimum` demetinden küçük değilse True; modülü import etmez"""
+    try:
+        version = importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    parts = tuple(int(part) for part in re.findall(r"\d+", version)[:len(minimum)])
+    return parts >= tuple(minimum)
+
+
+class StartupTimer:
+    """Başlangıç aşamalarının süresini (ilk zaman damgasından itibaren) kaydeder"""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = []
+
+    def mark(self, name):
+        self.marks.append((name, (time.perf_counter() - self.started) * 1000))
+
+    def summary(self, label):
+        parts = [f"{name} {ms:.0f} ms" for name, ms in self.marks]
+        return f"Başlangıç ({label}): {', '.join(parts)}"
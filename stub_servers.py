@@ -0,0 +1,98 @@
+"""
+Yerel sahte çeviri sunucuları (ölçüm ve deneme amaçlı).
+
+LibreTranslate'in /translate uç noktasını taklit eder: form veya JSON
+gövdesindeki `q` alanını (tek metin ya da liste) alır ve ters çevrilmiş
+metni döner. Gecikme, durum kodu ve hata oranı ayarlanabilir.
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # Eşzamanlı bağlantılar SYN yeniden denemesine düşmesin
+
+
+def fake_translate(text):
+    return text[::-1]
+
+
+class StubLibreTranslate:
+    """Arka planda çalışan sahte LibreTranslate sunucusu.
+
+    Kullanım:
+        with StubLibreTranslate(delay_s=0.05) as stub:
+            requests.post(stub.url, data={'q': 'hello'})
+    """
+
+    def __init__(self, delay_s=0.0, status=200, failure_rate=0.0, seed=None):
+        self.delay_s = delay_s
+        self.status = status
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.bytes_received = 0
+        self._random = random.Random(seed)
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            wbufsize = -1  # Başlık ve gövde tek pakette gitsin (Nagle gecikmesi olmasın)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length)
+                stub.requests += 1
+                stub.bytes_received += length
+                if stub.delay_s:
+                    time.sleep(stub.delay_s)
+                if stub.status != 200 or stub._random.random() < stub.failure_rate:
+                    self._reply(stub.status if stub.status != 200 else 500, {'error': 'stub'})
+                    return
+                if self.headers.get('Content-Type', '').startswith('application/json'):
+                    query = json.loads(body or b'{}').get('q', '')
+                else:
+                    values = parse_qs(body.decode('utf-8')).get('q', [''])
+                    query = values if len(values) > 1 else values[0]
+                if isinstance(query, list):
+                    result = [fake_translate(q) for q in query]
+                else:
+                    result = fake_translate(query)
+                self._reply(200, {'translatedText': result})
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = _StubHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/translate"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
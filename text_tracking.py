@@ -0,0 +1,282 @@
+"""
+Ardışık OCR okumaları üzerinde metin düzeyinde değişim algılama.
+
+OCR motorları aynı durağan metni kareden kareye biraz farklı okur (l/I,
+düşen bir nokta). Bu okumalar ağ çevirisini ve ekran yenilemesini boşuna
+tetiklemesin diye normalleştirilmiş düzenleme uzaklığıyla benzerlik ölçülür.
+Harf harf beliren metin ise büyümesi durana kadar bekletilir.
+"""
+import re
+import threading
+import time
+from collections import deque
+
+from translation_cache import normalize_text
+
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def edit_distance(a, b, limit=None):
+    """Levenshtein uzaklığı.
+
+    `limit` verilirse yalnızca köşegen çevresindeki bant hesaplanır ve
+    uzaklık limiti aştığında limit + 1 döner (O(n * limit)).
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is None:
+        limit = len(a)
+    if len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+    over = limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        current = [over] * (len(b) + 1)
+        current[0] = i if i <= limit else over
+        row_min = current[0]
+        for j in range(low, high + 1):
+            cost = 0 if ca == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        previous = current
+    return min(previous[len(b)], over)
+
+
+def similarity(a, b, threshold=0.0):
+    """1 - (uzaklık / uzun metnin boyu). Sonuç eşiğin altındaysa kesin değeri değil alt sınırı verir."""
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    limit = int((1.0 - threshold) * longest)
+    return 1.0 - edit_distance(a, b, limit) / longest
+
+
+class JitterFilter:
+    """Gösterilen metnin OCR titreşimi olan tekrarlarını eler.
+
+    Bir okuma, gösterilen metne (çapa) ya da o metnin son `history`
+    varyantından birine en az `threshold` benzerse değişmemiş sayılır.
+    Varyantlar çapaya benzer olduğundan kayma en fazla iki eşik payı
+    kadar birikebilir. Sayılar farklıysa (skor, saat, seviye) metin her
+    zaman değişmiş sayılır.
+    """
+
+    def __init__(self, threshold=0.9, history=3):
+        self.threshold = threshold
+        self.history = max(1, int(history))
+        self.readings = 0
+        self.suppressed = 0
+        self._anchor = None
+        self._variants = deque(maxlen=self.history)
+        self._lock = threading.Lock()
+
+    def _same(self, a, b):
+        if a == b:
+            return True
+        if _DIGITS_RE.findall(a) != _DIGITS_RE.findall(b):
+            return False
+        return similarity(a, b, self.threshold) >= self.threshold
+
+    def is_new(self, text):
+        """Metin gösterilenden gerçekten farklıysa True döner ve onu yeni çapa yapar"""
+        normalized = normalize_text(text)
+        with self._lock:
+            self.readings += 1
+            if self._anchor is not None and (
+                self._same(normalized, self._anchor)
+                or any(self._same(normalized, variant) for variant in self._variants)
+            ):
+                self.suppressed += 1
+                if normalized != self._anchor:
+                    self._variants.append(normalized)
+                return False
+            self._anchor = normalized
+            self._variants.clear()
+            return True
+
+    def reset(self):
+        with self._lock:
+            self._anchor = None
+            self._variants.clear()
+
+    def stats_text(self):
+        rate = self.suppressed / self.readings if self.readings else 0.0
+        return f"Titreşim: {self.suppressed}/{self.readings} okuma elendi (%{rate * 100:.0f})"
+
+
+class TextStabilizer:
+    """Harf harf beliren (daktilo efektli) metni büyümesi durana kadar bekletir.
+
+    Her OCR okuması `observe` ile verilir. Metin bir önceki okumanın
+    devamıysa büyüyor sayılır; `settle_frames` okuma boyunca ya da
+    `settle_ms` süresince büyümezse oturmuş kabul edilir ve bir kez
+    çevrilmek üzere döner. `provisional_ms` verilirse büyüyen metin en
+    fazla bu aralıkla geçici olarak da döner. İki ölçüt de 0 ise metin
+    beklemeden döner.
+    """
+
+    def __init__(self, settle_frames=2, settle_ms=300, provisional_ms=0, threshold=0.9, clock=None):
+        self.settle_frames = max(0, int(settle_frames))
+        self.settle_ms = max(0, int(settle_ms))
+        self.provisional_ms = max(0, int(provisional_ms))
+        self.threshold = threshold
+        self.clock = clock or time.monotonic
+        self.readings = 0
+        self.settled = 0
+        self.provisional = 0
+        self._pending = None
+        self._stable_frames = 0
+        self._last_growth = 0.0
+        self._last_provisional = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self):
+        """Oturmayı bekleyen metin var mı (yakalama döngüsü bu sürede OCR'ı zorlar)"""
+        return self._pending is not None
+
+    def _grew(self, old, new):
+        return len(new) > len(old) and similarity(old, new[:len(old)], self.threshold) >= self.threshold
+
+    def _settled(self, now):
+        if not self.settle_frames and not self.settle_ms:
+            return True
+        if self.settle_frames and self._stable_frames >= self.settle_frames:
+            return True
+        return bool(self.settle_ms) and (now - self._last_growth) * 1000 >= self.settle_ms
+
+    def observe(self, text):
+        """(metin, kesin_mi) döner; bekletiliyorsa (None, False)"""
+        now = self.clock()
+        with self._lock:
+            self.readings += 1
+            pending = self._pending
+            if pending is not None and not self._grew(pending, text) and (
+                text == pending or similarity(pending, text, self.threshold) >= self.threshold
+            ):
+                self._stable_frames += 1
+            else:
+                # Metin büyüdü ya da tamamen yeni bir metin başladı
+                if pending is None or not self._grew(pending, text):
+                    self._last_provisional = None
+                self._pending = text
+                self._stable_frames = 0
+                self._last_growth = now
+
+            if self._settled(now):
+                text = self._pending
+                self._pending = None
+                self.settled += 1
+                return text, True
+            if self.provisional_ms and (
+                self._last_provisional is None
+                or (now - self._last_provisional) * 1000 >= self.provisional_ms
+            ) and self._stable_frames == 0:
+                self._last_provisional = now
+                self.provisional += 1
+                return self._pending, False
+            return None, False
+
+    def reset(self):
+        with self._lock:
+            self._pending = None
+            self._stable_frames = 0
+            self._last_provisional = None
+
+    def stats_text(self):
+        return f"Dengeleme: {self.readings} okuma -> {self.settled} çeviri ({self.provisional} geçici)"
+
+
+# -----------------------------------------------------
+# ARTIMLI ÇEVİRİ
+# -----------------------------------------------------
+def line_overlap(previous, current, threshold=1.0):
+    """`previous`un son k satırı `current`in ilk k satırına eşitse en büyük k.
+
+    Sohbet/günlük bölgelerinde yeni okuma, eski okumanın üstten kayan
+    satırları atılmış ve altına yeni satırlar eklenmiş halidir. Eşik 1'den
+    küçükse OCR titreşimi olan satırlar da eşit sayılır; sayıları farklı
+    satırlar (JitterFilter'daki gibi) hiçbir zaman eşit sayılmaz.
+    """
+    def same(a, b):
+        if a == b:
+            return True
+        if threshold >= 1.0 or _DIGITS_RE.findall(a) != _DIGITS_RE.findall(b):
+            return False
+        return similarity(a, b, threshold) >= threshold
+
+    previous = [normalize_text(line) for line in previous]
+    current = [normalize_text(line) for line in current]
+    for k in range(min(len(previous), len(current)), 0, -1):
+        start = len(previous) - k
+        if all(same(previous[start + i], current[i]) for i in range(k)):
+            return k
+    return 0
+
+
+class IncrementalTranslator:
+    """Önceki okumayla örtüşen satırların çevirisini yeniden kullanır.
+
+    Çeviri satır satır tutulur (`translate_lines` satır listesini aynı
+    sırayla çevirir; toplu istek ya da asenkron istemciyle gönderebilir).
+    Yeni okumada üstten kayan satırlar atılır, yalnızca eklenen satırlar
+    çevrilip sona eklenir; böylece maliyet bölge boyutuyla değil yeni
+    metinle orantılıdır. Kayma miktarı benzerlikle bulunur, ama bir satırın
+    çevirisi yalnızca normalleştirilmiş hali birebir aynıysa yeniden
+    kullanılır; benzer ama farklı okunan satır yeniden çevrilir. `is_valid`
+    geçersiz saydığı çeviriler (hata mesajları) saklanmaz.
+    """
+
+    def __init__(self, translate_lines, is_valid=None, threshold=0.9):
+        self.translate_lines = translate_lines
+        self.is_valid = is_valid or (lambda result: True)
+        self.threshold = threshold
+        self.chars_total = 0
+        self.chars_translated = 0
+        self._lines = []  # [(satır, çeviri ya da None)]
+        self._lock = threading.Lock()
+
+    def translate(self, text):
+        lines = text.split("\n")
+        with self._lock:
+            stored = list(self._lines)
+        previous = [line for line, _ in stored]
+        overlap = line_overlap(previous, lines, self.threshold)
+        self.chars_total += len(text)
+
+        # stored[skip + i] yeni okumadaki lines[i] satırına karşılık gelir
+        skip = len(previous) - overlap
+        translations = [None] * len(lines)
+        for i in range(overlap):
+            old_line, translation = stored[skip + i]
+            if translation is not None and normalize_text(old_line) == normalize_text(lines[i]):
+                translations[i] = translation
+        missing = [i for i, translation in enumerate(translations) if translation is None]
+        if missing:
+            self.chars_translated += sum(len(lines[i]) for i in missing)
+            for i, translation in zip(missing, self.translate_lines([lines[i] for i in missing])):
+                translations[i] = translation
+
+        with self._lock:
+            # Hatalı satır çevirileri saklanmaz; sonraki okumada yeniden çevrilir
+            self._lines = [
+                (line, translation if self.is_valid(translation) else None)
+                for line, translation in zip(lines, translations)
+            ]
+        return "\n".join(translations)
+
+    def reset(self):
+        with self._lock:
+            self._lines = []
+
+    def stats_text(self):
+        rate = self.chars_translated / self.chars_total if self.chars_total else 0.0
+        return f"Artımlı: metnin %{rate * 100:.0f}'i çevrildi"
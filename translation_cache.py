@@ -0,0 +1,153 @@
+"""
+Kalıcı çeviri önbelleği.
+
+Bellekte LRU, diskte SQLite. Anahtar (servis, kaynak dil, hedef dil,
+normalleştirilmiş metin) dörtlüsüdür.
+"""
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# OCR'ın satır başı/sonuna sıkça eklediği anlamsız karakterler
+_OCR_NOISE_CHARS = "|_~`¦•·"
+_WHITESPACE_RE = re.compile(r"\s+")
+_QUOTE_MAP = str.maketrans({
+    "‘": "'", "’": "'", "‚": "'",
+    "“": '"', "”": '"', "„": '"',
+    "–": "-", "—": "-",
+})
+
+
+def normalize_text(text):
+    """Önbellek anahtarı için metni normalleştirir (boşluk ve OCR gürültüsü)"""
+    text = unicodedata.normalize('NFKC', text).translate(_QUOTE_MAP)
+    text = _WHITESPACE_RE.sub(" ", text)
+    return text.strip().strip(_OCR_NOISE_CHARS).strip()
+
+
+class TranslationCache:
+    """Bellek içi LRU + SQLite destekli çeviri önbelleği.
+
+    `path` None ise yalnızca bellek kullanılır.
+    """
+
+    def __init__(self, path=None, max_entries=2000, max_disk_entries=50000):
+        self.max_entries = max(1, int(max_entries))
+        self.max_disk_entries = max(self.max_entries, int(max_disk_entries))
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._puts_since_trim = 0
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    " service TEXT, source TEXT, target TEXT, text TEXT,"
+                    " translation TEXT, last_used REAL,"
+                    " PRIMARY KEY (service, source, target, text))"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Çeviri önbelleği açılamadı ({path}): {e}")
+                self._db = None
+
+    @staticmethod
+    def make_key(service, source_lang, target_lang, text):
+        return (service, source_lang, target_lang, normalize_text(text))
+
+    def get(self, service, source_lang, target_lang, text):
+        """Önbellekteki çeviriyi döner, yoksa None"""
+        key = self.make_key(service, source_lang, target_lang, text)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT translation FROM translations"
+                        " WHERE service=? AND source=? AND target=? AND text=?",
+                        key
+                    ).fetchone()
+                    if row is not None:
+                        self._db.execute(
+                            "UPDATE translations SET last_used=?"
+                            " WHERE service=? AND source=? AND target=? AND text=?",
+                            (time.time(),) + key
+                        )
+                        self._db.commit()
+                        self._remember(key, row[0])
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return row[0]
+                except sqlite3.Error as e:
+                    print(f"Çeviri önbelleği okuma hatası: {e}")
+            self.misses += 1
+            return None
+
+    def put(self, service, source_lang, target_lang, text, translation):
+        key = self.make_key(service, source_lang, target_lang, text)
+        if not key[3]:
+            return
+        with self._lock:
+            self._remember(key, translation)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                    key + (translation, time.time())
+                )
+                self._puts_since_trim += 1
+                if self._puts_since_trim >= 100:
+                    self._trim_disk()
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Çeviri önbelleği yazma hatası: {e}")
+
+    def _remember(self, key, translation):
+        self._memory[key] = translation
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _trim_disk(self):
+        # En uzun süredir kullanılmayan kayıtları sil
+        self._puts_since_trim = 0
+        self._db.execute(
+            "DELETE FROM translations WHERE rowid IN ("
+            " SELECT rowid FROM translations ORDER BY last_used DESC"
+            " LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,)
+        )
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM translations")
+                self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats_text(self):
+        return f"Önbellek: {self.hits} isabet / {self.misses} ıska (%{self.hit_rate * 100:.0f})"
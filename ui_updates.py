@@ -0,0 +1,53 @@
+"""
+Arka plan iş parçacıklarından Tkinter arayüzünü güvenle güncellemek için
+mesaj kuyruğu.
+
+Tkinter iş parçacığı güvenli değildir; widget'lara yalnızca ana döngüden
+dokunulmalıdır. İşçiler güncellemeleri buraya bırakır, ana döngü
+`root.after` ile sabit kare hızında boşaltır. Aynı anahtara gelen
+güncellemeler birleştirilir: yalnızca sonuncusu uygulanır.
+"""
+import threading
+from collections import OrderedDict
+
+
+class UIUpdateQueue:
+    def __init__(self, root, fps=30):
+        self.root = root
+        self.interval_ms = max(1, int(1000 / max(1, fps)))
+        self.posted = 0
+        self.applied = 0
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._running = False
+
+    def post(self, key, func, *args, **kwargs):
+        """Güncellemeyi sıraya koyar; aynı anahtarlı bekleyen güncellemenin yerine geçer"""
+        with self._lock:
+            self._pending.pop(key, None)
+            self._pending[key] = (func, args, kwargs)
+            self.posted += 1
+
+    def drain(self):
+        """Bekleyen güncellemeleri uygular (yalnızca ana iş parçacığından çağrılmalı)"""
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+        for func, args, kwargs in pending.values():
+            try:
+                func(*args, **kwargs)
+                self.applied += 1
+            except Exception as e:
+                print(f"Arayüz güncelleme hatası: {e}")
+
+    def _tick(self):
+        if not self._running:
+            return
+        self.drain()
+        self.root.after(self.interval_ms, self._tick)
+
+    def start(self):
+        self._running = True
+        self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        self._running = False